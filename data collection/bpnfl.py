@@ -1,5 +1,16 @@
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import time
+
+import aiohttp
+import orjson
 import requests
 from pprint import pprint
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # API Configuration
 BASE_URL = "https://api.bettingpros.com/v3"
@@ -44,7 +55,75 @@ MARKET_CONFIG = {
     }
 }
 
+# Offers are fetched concurrently in chunks of event_ids so a big NFL week
+# doesn't serialize into one slow request (or blow past URL-length limits).
+EVENT_ID_CHUNK_SIZE = 10
+CONNECTOR_LIMIT = 32
+
+# Offer responses are identical for identical (market_id, event_ids, location)
+# tuples, so memoize them in-process and mirror to a small on-disk TTL cache
+# for repeated script runs during dev.
+OFFER_CACHE_DIR = ".bp_cache"
+OFFER_CACHE_TTL = 300  # seconds
+
+# Retry transient failures with backoff instead of failing a whole market.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+REQUEST_TIMEOUT = 10  # seconds
+
+# Shared session for the synchronous event fetch: pooled connections plus
+# retry-with-backoff, mirroring dk_pools.get_session().
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=MAX_RETRIES, backoff_factor=BACKOFF_FACTOR,
+                      status_forcelist=RETRY_STATUSES),
+))
+
 class BettingAPI:
+    def __init__(self):
+        self._session = None
+        self._offer_cache = {}
+
+    @staticmethod
+    def _offer_cache_path(cache_key):
+        digest = hashlib.sha1(repr(cache_key).encode()).hexdigest()
+        return os.path.join(OFFER_CACHE_DIR, f"{digest}.json")
+
+    def _read_disk_cache(self, cache_key):
+        path = self._offer_cache_path(cache_key)
+        try:
+            if time.time() - os.path.getmtime(path) > OFFER_CACHE_TTL:
+                return None
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk_cache(self, cache_key, offers):
+        try:
+            os.makedirs(OFFER_CACHE_DIR, exist_ok=True)
+            with open(self._offer_cache_path(cache_key), 'w') as f:
+                json.dump(offers, f)
+        except OSError as e:
+            print(f"Error writing offer cache: {e}")
+
+    def _get_session(self):
+        # Lazily created so the session is bound to the running event loop.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=HEADERS,
+                connector=aiohttp.TCPConnector(limit=CONNECTOR_LIMIT),
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
     def fetch_events(self, sport="NFL", week=19, season=2024):
         params = {
             "sport": sport,
@@ -52,111 +131,173 @@ class BettingAPI:
             "season": season
         }
         try:
-            response = requests.get(BASE_URL_EVENTS, headers=HEADERS, params=params)
+            response = _session.get(BASE_URL_EVENTS, headers=HEADERS, params=params,
+                                    timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            events = response.json().get('events', [])
+            events = orjson.loads(response.content).get('events', [])
             return [str(event['id']) for event in events]  # Removed slicing to get all events
         except Exception as e:
             print(f"Error fetching events: {e}")
             return []
 
-    def fetch_all_offers(self, market_id, event_ids):
-        if not event_ids:
-            return []
-        
-        offers = []
-        # Assuming the API supports pagination, you might need to handle it here.
-        # For simplicity, we'll fetch without a limit parameter to get all offers.
+    async def _fetch_offer_chunk(self, market_id, event_ids, location):
         params = {
             "sport": "NFL",
             "market_id": market_id,
             "event_id": ','.join(event_ids),
-            "location": "OH",
-            # Removed 'limit': 1 to fetch all offers
+            "location": location,
         }
-        try:
-            response = requests.get(BASE_URL_OFFERS, headers=HEADERS, params=params)
-            response.raise_for_status()
-            data = response.json()
-            offers.extend(data.get('offers', []))
-            # If the API uses pagination, handle additional pages here
-            return offers
-        except Exception as e:
-            print(f"Error fetching offers: {e}")
+        # aiohttp has no HTTPAdapter-style retry, so back off manually on
+        # transient statuses/connection errors.
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with self._get_session().get(BASE_URL_OFFERS, params=params) as response:
+                    if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                        raise aiohttp.ClientResponseError(
+                            response.request_info, response.history,
+                            status=response.status)
+                    response.raise_for_status()
+                    data = orjson.loads(await response.read())
+                    return data.get('offers', [])
+            except Exception as e:
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(BACKOFF_FACTOR * (2 ** attempt))
+                    continue
+                print(f"Error fetching offers: {e}")
+                # None marks terminal failure, distinct from a chunk that
+                # legitimately has no offers, so callers can skip caching.
+                return None
+
+    async def fetch_all_offers(self, market_id, event_ids, location="OH"):
+        if not event_ids:
             return []
 
+        cache_key = (market_id, tuple(event_ids), location)
+        if cache_key in self._offer_cache:
+            return self._offer_cache[cache_key]
+        cached = self._read_disk_cache(cache_key)
+        if cached is not None:
+            self._offer_cache[cache_key] = cached
+            return cached
+
+        chunks = [event_ids[i:i + EVENT_ID_CHUNK_SIZE]
+                  for i in range(0, len(event_ids), EVENT_ID_CHUNK_SIZE)]
+        results = await asyncio.gather(
+            *(self._fetch_offer_chunk(market_id, chunk, location) for chunk in chunks)
+        )
+        offers = []
+        failed = False
+        for chunk_offers in results:
+            if chunk_offers is None:
+                failed = True
+            else:
+                offers.extend(chunk_offers)
+        # Only cache complete results: a failed chunk would otherwise be
+        # served as "no offers" for the whole TTL.
+        if not failed:
+            self._offer_cache[cache_key] = offers
+            self._write_disk_cache(cache_key, offers)
+        return offers
+
 class MarketPrinter:
     def __init__(self):
         self.api = BettingAPI()
         self.event_ids = self.api.fetch_events()
 
-    def print_game_lines(self, market_name, market_id):
+    def print_game_lines(self, market_name, market_id, offers):
         print(f"\n{market_name.upper()} (Market ID: {market_id})")
         print("-" * 40)
-        
-        offers = self.api.fetch_all_offers(market_id, self.event_ids)
+
         if offers:
+            # Hoist dict lookups out of the (selection x book x line) loop.
+            bget = BOOKIE_MAP.get
+            is_total = market_name == 'total'
+            out = sys.stdout.write
             for offer in offers:
-                # Print teams
+                # Buffer each offer's lines into one write to cut syscalls.
+                buf = []
                 teams = [p['name'] for p in offer.get('participants', [])]
                 if teams:
-                    print(f"Teams: {' vs '.join(teams)}")
-                
-                # Print lines for each book
+                    buf.append(f"Teams: {' vs '.join(teams)}")
+
+                # Lines for each book
                 for selection in offer.get('selections', []):
+                    label = selection['label']
                     for book in selection.get('books', []):
-                        bookie = BOOKIE_MAP.get(book['id'], str(book['id']))
+                        book_id = book['id']
+                        bookie = bget(book_id, str(book_id))
                         for line in book.get('lines', []):
-                            if line.get('active') and not line.get('replaced'):
-                                odds = line.get('cost')
-                                line_value = line.get('line')
-                                
-                                if market_name == 'total':
-                                    print(f"{bookie}: {selection['label']} {line_value} ({odds})")
-                                else:
-                                    print(f"{bookie}: {selection['label']} {f'{line_value} ' if line_value != 1 else ''}({odds})")
-                print("-" * 40)  # Separator between offers
+                            if not line.get('active') or line.get('replaced'):
+                                continue
+                            odds = line['cost']
+                            line_value = line['line']
+
+                            if is_total:
+                                buf.append(f"{bookie}: {label} {line_value} ({odds})")
+                            else:
+                                buf.append(f"{bookie}: {label} {f'{line_value} ' if line_value != 1 else ''}({odds})")
+                buf.append("-" * 40)  # Separator between offers
+                out('\n'.join(buf) + '\n')
         else:
             print("No offers found for this market.")
 
-    def print_props(self, market_name, market_id):
+    def print_props(self, market_name, market_id, offers):
         print(f"\n{market_name} (Market ID: {market_id})")
         print("-" * 40)
-        
-        offers = self.api.fetch_all_offers(market_id, self.event_ids)
+
         if offers:
+            bget = BOOKIE_MAP.get
+            out = sys.stdout.write
             for offer in offers:
-                # Print player info
+                buf = []
+                # Player info
                 if offer.get('participants'):
                     player = offer['participants'][0].get('player', {})
-                    print(f"Player: {player.get('first_name', '')} {player.get('last_name', '')} "
-                          f"({player.get('position', '')}) - {player.get('team', '')}")
-                
-                # Print lines for each book
+                    buf.append(f"Player: {player.get('first_name', '')} {player.get('last_name', '')} "
+                               f"({player.get('position', '')}) - {player.get('team', '')}")
+
+                # Lines for each book
                 for selection in offer.get('selections', []):
+                    label = selection['label']
                     for book in selection.get('books', []):
-                        bookie = BOOKIE_MAP.get(book['id'], str(book['id']))
+                        book_id = book['id']
+                        bookie = bget(book_id, str(book_id))
                         for line in book.get('lines', []):
-                            if line.get('active') and not line.get('replaced'):
-                                odds = line.get('cost')
-                                line_value = line.get('line')
-                                print(f"{bookie}: {selection['label']} {line_value} ({odds})")
-                print("-" * 40)  # Separator between offers
+                            if not line.get('active') or line.get('replaced'):
+                                continue
+                            buf.append(f"{bookie}: {label} {line['line']} ({line['cost']})")
+                buf.append("-" * 40)  # Separator between offers
+                out('\n'.join(buf) + '\n')
         else:
             print("No offers found for this market.")
 
     def print_all_markets(self):
+        # Fetch every market's offers in one gather so all 13 markets
+        # (each already chunked by event_id) hit the API concurrently.
+        market_ids = list(MARKET_CONFIG['game_lines'].values()) + list(MARKET_CONFIG['props'].keys())
+
+        async def fetch_markets():
+            try:
+                return await asyncio.gather(
+                    *(self.api.fetch_all_offers(market_id, self.event_ids)
+                      for market_id in market_ids)
+                )
+            finally:
+                await self.api.close()
+
+        offers_by_market = dict(zip(market_ids, asyncio.run(fetch_markets())))
+
         # Print game lines markets
         print("\nGAME LINES MARKETS")
         print("=" * 50)
         for market_name, market_id in MARKET_CONFIG['game_lines'].items():
-            self.print_game_lines(market_name, market_id)
-            
+            self.print_game_lines(market_name, market_id, offers_by_market[market_id])
+
         # Print props markets
         print("\nPROPS MARKETS")
         print("=" * 50)
         for market_id, market_name in MARKET_CONFIG['props'].items():
-            self.print_props(market_name, market_id)
+            self.print_props(market_name, market_id, offers_by_market[market_id])
 
 def main():
     printer = MarketPrinter()
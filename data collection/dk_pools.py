@@ -2,7 +2,11 @@ import requests
 import pandas as pd
 import os
 import sys
-import json  # Import json module for handling JSON data
+import orjson
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import ijson
 from requests.adapters import HTTPAdapter
 
 # Constants
@@ -24,28 +28,36 @@ SPORTS_ENDPOINT = "https://api.draftkings.com/sites/US-DK/sports/v1/sports?forma
 CONTESTS_ENDPOINT = "https://www.draftkings.com/lobby/getcontests?sport={sport}"
 DRAFTABLES_ENDPOINT = "https://api.draftkings.com/draftgroups/v1/draftgroups/{draftgroup_id}/draftables"
 
+# Concurrency for per-draftgroup draftables fetches
+MAX_FETCH_WORKERS = 16
+# Concurrency for the outer per-sport contests scan
+MAX_SPORT_WORKERS = 8
+
 # Session setup with retry mechanism
 def get_session():
-    """Create a session with retry mechanism for handling transient errors."""
+    """Create a session with retry mechanism and a pool sized for concurrent fetches."""
     session = requests.Session()
-    adapter = HTTPAdapter(max_retries=3)
+    adapter = HTTPAdapter(max_retries=3, pool_connections=MAX_FETCH_WORKERS, pool_maxsize=MAX_SPORT_WORKERS * MAX_FETCH_WORKERS)
     session.mount("https://", adapter)
     return session
 
 # Use session to make requests
 session = get_session()
 
-# Debugging
+# Debugging (lock keeps messages from interleaving across fetch threads)
+_debug_lock = threading.Lock()
+
 def debug_log(message):
     if DEBUG_MODE:
-        print(f"[DEBUG] {message}")
+        with _debug_lock:
+            print(f"[DEBUG] {message}")
 
 def fetch_sports():
     """Fetch all sports with their regionAbbreviatedSportName."""
     try:
         response = session.get(SPORTS_ENDPOINT, timeout=10)
         response.raise_for_status()
-        sports_data = response.json()
+        sports_data = orjson.loads(response.content)
         return [sport['regionAbbreviatedSportName'] for sport in sports_data.get('sports', [])]
     except requests.RequestException as e:
         print(f"Error fetching sports: {e}")
@@ -55,21 +67,30 @@ def fetch_draftables(draftgroup_id):
     """Fetch draftable players for a specific draft group, only returning players with a non-null salary."""
     url = DRAFTABLES_ENDPOINT.format(draftgroup_id=draftgroup_id)
     try:
-        response = session.get(url, timeout=10)
+        response = session.get(url, timeout=10, stream=True)
         response.raise_for_status()
-        data = response.json()
-        # Only return players with a non-null salary, using a dictionary to remove duplicates
-        players = {
-            player['displayName']: {
-                'displayName': player['displayName'],
-                'salary': player['salary'],
+        # Stream-parse the draftables array instead of materializing the whole
+        # multi-MB JSON body; we only need three fields per player.
+        response.raw.decode_content = True
+        # Single pass with a set guard: append unique salaried players directly
+        # instead of building an intermediate dict and copying its values out.
+        seen = set()
+        players = []
+        for player in ijson.items(response.raw, 'draftables.item'):
+            salary = player.get('salary')
+            if salary is None:  # Ensure salary is not null
+                continue
+            name = player['displayName']
+            if name in seen:
+                continue
+            seen.add(name)
+            players.append({
+                'displayName': name,
+                'salary': salary,
                 'teamAbbreviation': player['teamAbbreviation']
-            }
-            for player in data.get('draftables', [])
-            if player.get('salary') is not None  # Ensure salary is not null
-        }
+            })
         debug_log(f"Fetched {len(players)} unique players with salary for DraftGroupId {draftgroup_id}.")
-        return list(players.values())  # Convert back to list to return unique players
+        return players
     except requests.RequestException as e:
         print(f"Error fetching draftables for DraftGroupId {draftgroup_id}: {e}")
         return []
@@ -80,7 +101,7 @@ def fetch_draftgroups(sport):
     try:
         response = session.get(url, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Save the raw draft groups response per sport
         if SAVE_RAW_DRAFTGROUPS:
@@ -90,7 +111,8 @@ def fetch_draftgroups(sport):
         # - Are tagged as "Featured"
         # - Have a desired GameType
         # - Contain at least one player with a non-null salary
-        draftgroups = []
+        # Pass 1: collect candidate draft groups after the tag/GameType filter.
+        candidates = []
         excluded_game_types = 0
         for group in data.get('Contests', []):  # Changed from 'DraftGroups' to 'Contests'
             if group.get("DraftGroupTag") == "Featured":
@@ -99,27 +121,31 @@ def fetch_draftgroups(sport):
                     excluded_game_types += 1
                     debug_log(f"DraftGroupId {group['dg']} excluded due to GameType: {game_type}")
                     continue  # Skip this draft group as its GameType is not desired
-                
-                draftgroup_id = group['dg']  # Assuming 'dg' is DraftGroupId
-                contest_type_id = group['pt']  # Assuming 'pt' is ContestTypeId
-                game_count = group.get('cs', '')  # Assuming 'cs' is GameCount
-                start_time_suffix = group.get('sdstring', '')
-                
-                # Fetch draftables for this draftgroup_id and check for salary
-                players = fetch_draftables(draftgroup_id)
+
+                candidates.append({
+                    'DraftGroupId': group['dg'],  # Assuming 'dg' is DraftGroupId
+                    'ContestTypeId': group['pt'],  # Assuming 'pt' is ContestTypeId
+                    'GameCount': group.get('cs', ''),  # Assuming 'cs' is GameCount
+                    'ContestStartTimeSuffix': group.get('sdstring', ''),
+                    'GameType': game_type,
+                })
+
+        # Pass 2: fetch draftables for all candidates concurrently; each call is
+        # a blocking HTTPS round-trip, so threads collapse N RTTs into ~1.
+        draftgroups = []
+        if candidates:
+            ids = [c['DraftGroupId'] for c in candidates]
+            with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+                players_by_id = dict(zip(ids, executor.map(fetch_draftables, ids)))
+            for candidate in candidates:
+                players = players_by_id[candidate['DraftGroupId']]
                 if players:  # Only add if there's at least one player with a salary
-                    draftgroups.append({
-                        'DraftGroupId': draftgroup_id,
-                        'ContestTypeId': contest_type_id,
-                        'GameCount': game_count,
-                        'ContestStartTimeSuffix': start_time_suffix,
-                        'GameType': game_type,
-                        'Players': players
-                    })
-                    debug_log(f"DraftGroupId {draftgroup_id} added (GameType: {game_type}, contains salaried players).")
+                    candidate['Players'] = players
+                    draftgroups.append(candidate)
+                    debug_log(f"DraftGroupId {candidate['DraftGroupId']} added (GameType: {candidate['GameType']}, contains salaried players).")
                 else:
-                    debug_log(f"DraftGroupId {draftgroup_id} skipped (no salaried players).")
-        
+                    debug_log(f"DraftGroupId {candidate['DraftGroupId']} skipped (no salaried players).")
+
         if excluded_game_types > 0:
             print(f"Excluded {excluded_game_types} draft group(s) due to undesired GameTypes.")
         
@@ -129,13 +155,14 @@ def fetch_draftgroups(sport):
         print(f"Error fetching draft groups for {sport}: {e}")
         return []
 
+@lru_cache(maxsize=128)
 def fetch_draftgroup_raw(draftgroup_id):
-    """Fetch the raw JSON response for a specific draft group."""
+    """Fetch the raw JSON response for a specific draft group (memoized per run)."""
     url = DRAFTABLES_ENDPOINT.format(draftgroup_id=draftgroup_id)
     try:
         response = session.get(url, timeout=10)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     except requests.RequestException as e:
         print(f"Error fetching raw data for DraftGroupId {draftgroup_id}: {e}")
         return None
@@ -150,8 +177,10 @@ def save_raw_json(draftgroup_id, raw_data, draftgroup_type):
     file_path = os.path.join(RAW_DRAFTGROUP_JSON_DIR, filename)
     
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(raw_data, f, indent=4)
+        # orjson encodes straight to bytes; writing binary skips the Unicode
+        # copy json.dump would make for these multi-MB payloads.
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(raw_data, option=orjson.OPT_INDENT_2))
         debug_log(f"Raw JSON for DraftGroupId {draftgroup_id} saved to {file_path}.")
         print(f"Raw JSON response saved to: {file_path}")
     except IOError as e:
@@ -167,8 +196,8 @@ def save_raw_draftgroups(sport, raw_data):
     file_path = os.path.join(RAW_JSON_DIR, filename)
     
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(raw_data, f, indent=4)
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(raw_data, option=orjson.OPT_INDENT_2))
         debug_log(f"Raw draft groups JSON for {sport} saved to {file_path}.")
         print(f"Raw draft groups JSON response saved to: {file_path}")
     except IOError as e:
@@ -225,14 +254,13 @@ def main():
         print("No sports data available.")
         sys.exit(1)
     
-    # Step 2: For each sport, fetch the number of available slates (draft groups)
-    sport_slate_counts = {}
-    sport_draftgroups_map = {}  # To store draftgroups for each sport
-    for sport in sports:
-        debug_log(f"Processing sport: {sport}")
-        draftgroups = fetch_draftgroups(sport)
-        sport_slate_counts[sport] = len(draftgroups)
-        sport_draftgroups_map[sport] = draftgroups  # Store draftgroups for later use
+    # Step 2: For each sport, fetch the number of available slates (draft groups).
+    # Sports are independent, so scan them concurrently; each worker fans out its
+    # own draftables fetches via the inner pool in fetch_draftgroups.
+    debug_log(f"Processing {len(sports)} sports concurrently.")
+    with ThreadPoolExecutor(max_workers=MAX_SPORT_WORKERS) as executor:
+        sport_draftgroups_map = dict(zip(sports, executor.map(fetch_draftgroups, sports)))
+    sport_slate_counts = {sport: len(groups) for sport, groups in sport_draftgroups_map.items()}
     
     # Step 3: Display the list of sports with their respective slate counts
     print("\nAvailable Sports and Number of Slates:")
@@ -297,7 +325,7 @@ def main():
             save_raw_json(selected_draftgroup_id, raw_data, draftgroup_type)
         else:
             print("\nRaw JSON Response:")
-            print(json.dumps(raw_data, indent=4))  # Pretty-print the JSON
+            print(orjson.dumps(raw_data, option=orjson.OPT_INDENT_2).decode())  # Pretty-print the JSON
         
         # Optionally, save or print draftables data
         save_or_print_data(selected_sport, selected_draftgroup, draftgroup_type)
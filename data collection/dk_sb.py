@@ -1,7 +1,9 @@
 import requests
-import json
+import orjson
 import time
 
+DEBUG = False  # Set to True to dump raw JSON responses while troubleshooting
+
 # Define headers for requests
 headers = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:132.0) Gecko/20100101 Firefox/132.0",
@@ -33,11 +35,12 @@ def fetch_and_save_selections(league_id, categories, subcategories):
         response = requests.get(endpoint, headers=headers)
         if response.status_code == 200:
             print(f"Received status code 200 for subcategory {subcategory_name} (ID: {subcategory_id})")
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Debug: Print the raw JSON structure to examine
-            print("Raw JSON data received:")
-            print(json.dumps(data, indent=4))  # Only for troubleshooting, remove after verifying structure
+            if DEBUG:
+                print("Raw JSON data received:")
+                print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
 
             # Extract selections data
             extracted_selections = extract_selections_data(data)
@@ -53,8 +56,8 @@ def fetch_and_save_selections(league_id, categories, subcategories):
 
     # Save data to a JSON file
     output_filename = f"league_{league_id}_selections_data.json"
-    with open(output_filename, 'w') as f:
-        json.dump(all_data, f, indent=4)
+    with open(output_filename, 'wb') as f:
+        f.write(orjson.dumps(all_data, option=orjson.OPT_INDENT_2))
     print(f"Data successfully saved to {output_filename}")
 
 # Extract selections data from API response
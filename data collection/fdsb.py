@@ -1,5 +1,5 @@
 import requests
-import json
+import orjson
 
 headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:134.0) Gecko/20100101 Firefox/134.0',
@@ -29,5 +29,5 @@ params = {
 }
 
 response = requests.get('https://sbapi.oh.sportsbook.fanduel.com/api/event-page', params=params, headers=headers)
-data=response.json()
-print(json.dumps(data, indent=4)) 
\ No newline at end of file
+# Re-indent through orjson only; no stdlib json round-trip of the payload.
+print(orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2).decode())
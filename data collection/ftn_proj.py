@@ -1,19 +1,21 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
+import requests
 
-# Set up the webdriver (e.g., ChromeDriver)
-driver = webdriver.Chrome()
+# Direct CSV endpoint behind the "CSV" button (captured from the network tab).
+# Update the cookie if the download starts coming back as the login page.
+CSV_URL = "https://ftnfantasy.com/dfs/nfl/ownership-projections/csv"
+OUTPUT_FILE = "ownership_projections.csv"
 
-# Open the website
-driver.get("https://ftnfantasy.com/dfs/nfl/ownership-projections")
+headers = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:132.0) Gecko/20100101 Firefox/132.0",
+    "Accept": "text/csv,application/csv,*/*",
+    "Referer": "https://ftnfantasy.com/dfs/nfl/ownership-projections",
+    # 'Cookie': '<paste session cookie here if the endpoint requires login>',
+}
 
-# Find and click the "CSV" button
-csv_button = driver.find_element(By.XPATH, "/html/body/div[1]/main/section[2]/div/div[2]/div[2]/div[1]/button[3]/span]")
-csv_button.click()
+response = requests.get(CSV_URL, headers=headers, timeout=30)
+response.raise_for_status()
 
-# Wait for the download to complete, if necessary
-import time
-time.sleep(5)
-
-driver.quit()
+with open(OUTPUT_FILE, "wb") as f:
+    f.write(response.content)
 
+print(f"Saved ownership projections to {OUTPUT_FILE}")
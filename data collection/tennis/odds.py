@@ -14,6 +14,8 @@ URL_TEMPLATE = "http://www.tennisexplorer.com/matches/?type=all&year={year}&mont
 # Toggle to filter out lower-level tournaments by default.
 FILTER_LOW_LEVEL_TOURNAMENTS = True
 LOWER_LEVEL_KEYWORDS = ['UTR', 'ITF', 'Challenger', 'Futures']
+# Lowercased once at import; the scraper compares against normalized names.
+_LOWER_LEVEL_KEYWORDS_LC = tuple(kw.lower() for kw in LOWER_LEVEL_KEYWORDS)
 
 # Toggle to save snapshot data to a SQLite database.
 SAVE_TO_DB = False  # Set to True to persist data, False to disable while testing
@@ -34,26 +36,47 @@ UNMAPPED_SURFACE_MATCHES = []
 # Description: Provides helper functions for string normalization and other utilities.
 # ===========================
 import string
+from functools import lru_cache
 
+# Punctuation-stripping table, built once at import (normalize_name and the
+# vectorized CSV loaders share it).
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+@lru_cache(maxsize=8192)
 def normalize_name(name):
     """
     Normalize a string by stripping whitespace, lowering case, and removing punctuation.
-    
+    Results are memoized since tournament/player names repeat heavily across snapshots.
+
     Args:
         name (str): The input string.
     Returns:
         str: The normalized string.
     """
-    return name.strip().lower().translate(str.maketrans('', '', string.punctuation))
+    return name.strip().lower().translate(_PUNCT_TABLE)
 
 
 # ===========================
 # Section: Data Processing Subservice
 # Description: Functions to load tournament surfaces, name mappings, and calculate implied win percentages.
 # ===========================
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+def _read_map_csv(filename, usecols, **kwargs):
+    """
+    Read a mapping CSV with only the needed columns, preferring the pyarrow
+    engine (Arrow-backed strings, roughly half the memory) and falling back
+    to the default C engine if pyarrow is unavailable or rejects the file.
+    """
+    try:
+        return pd.read_csv(filename, usecols=usecols, engine='pyarrow',
+                           dtype_backend='pyarrow', **kwargs)
+    except Exception as e:
+        logging.debug(f"pyarrow engine failed for {filename}: {e}. Falling back to C engine.")
+        return pd.read_csv(filename, usecols=usecols, **kwargs)
+
 def load_surface_map(filename="surface_map.csv"):
     """
     Load the surface mapping from a CSV file with columns 'tournament' and 'surface'.
@@ -68,7 +91,7 @@ def load_surface_map(filename="surface_map.csv"):
     last_exception = None
     for enc in encodings_to_try:
         try:
-            df = pd.read_csv(filename, encoding=enc)
+            df = _read_map_csv(filename, usecols=['tournament', 'surface'], encoding=enc)
             logging.debug(f"Successfully loaded surface map file with encoding='{enc}'")
             break
         except Exception as e:
@@ -78,13 +101,12 @@ def load_surface_map(filename="surface_map.csv"):
         logging.error(f"All encoding attempts failed for {filename}. Last error: {last_exception}")
         return {}
     logging.debug(f"Surface map columns: {df.columns.tolist()}")
-    mapping = {}
     try:
-        for _, row in df.iterrows():
-            tournament = normalize_name(str(row['tournament']))
-            surface = str(row['surface']).strip()
-            mapping[tournament] = surface
-        return mapping
+        # Vectorized normalization; avoids per-row iterrows() boxing.
+        tournaments = (df['tournament'].astype(str).str.strip().str.lower()
+                       .str.translate(_PUNCT_TABLE))
+        surfaces = df['surface'].astype(str).str.strip()
+        return dict(zip(tournaments.to_numpy(), surfaces.to_numpy()))
     except KeyError as ke:
         logging.error(f"Error: Missing expected column in {filename}: {ke}")
         return {}
@@ -92,7 +114,27 @@ def load_surface_map(filename="surface_map.csv"):
         logging.error(f"Error processing surface map data from {filename}: {e}")
         return {}
 
-from thefuzz import process
+from rapidfuzz import fuzz, process
+
+# Cached choices + bigram index per name_map instance so fuzzy lookups don't
+# rebuild the key list (or scan all of it) on every query.
+_NAME_MAP_CHOICES = {}
+
+def _bigrams(text):
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+def _name_map_choices(name_map):
+    cached = _NAME_MAP_CHOICES.get(id(name_map))
+    if cached is None or len(cached[0]) != len(name_map):
+        # Tuple: immutable, so nothing downstream can mutate the cached copy.
+        choices = tuple(name_map.keys())
+        bigram_index = {}
+        for key in choices:
+            for bigram in _bigrams(key):
+                bigram_index.setdefault(bigram, []).append(key)
+        cached = (choices, bigram_index)
+        _NAME_MAP_CHOICES[id(name_map)] = cached
+    return cached
 
 def load_name_map(filename="name_map.csv"):
     """
@@ -108,21 +150,22 @@ def load_name_map(filename="name_map.csv"):
     logging.info(f"Attempting to load name map from: {filename}")
     try:
         try:
-            df = pd.read_csv(filename)
+            df = _read_map_csv(filename, usecols=['name1', 'name2'])
             logging.debug(f"Successfully loaded name map (comma-delimited): {filename}")
         except Exception as e:
             logging.debug(f"Comma delimiter failed: {e}. Trying tab-delimited...")
-            df = pd.read_csv(filename, sep='\t')
+            df = _read_map_csv(filename, usecols=['name1', 'name2'], sep='\t')
             logging.debug(f"Successfully loaded name map (tab-delimited): {filename}")
         logging.debug(f"Name map columns: {df.columns.tolist()}")
-        mapping = {}
-        for idx, row in df.iterrows():
-            standardized = str(row['name1']).strip()
-            alternate = str(row['name2']).strip()
-            alternate_norm = normalize_name(alternate)
-            mapping[alternate_norm] = {"standardized": standardized,
-                                       "raw": alternate,
-                                       "row": idx}
+        standardized = df['name1'].astype(str).str.strip()
+        alternates = df['name2'].astype(str).str.strip()
+        alternates_norm = alternates.str.lower().str.translate(_PUNCT_TABLE)
+        mapping = {
+            alt_norm: {"standardized": std, "raw": alt, "row": idx}
+            for alt_norm, std, alt, idx in zip(
+                alternates_norm.to_numpy(), standardized.to_numpy(),
+                alternates.to_numpy(), df.index.to_numpy())
+        }
         logging.info(f"Name map loaded. Total keys: {len(mapping)}")
         return mapping
     except Exception as e:
@@ -145,27 +188,45 @@ def calculate_implied_win_percentages(odds1, odds2):
     except ZeroDivisionError:
         return None, None
 
+def calculate_implied_win_percentages_vec(odds1, odds2):
+    """
+    Vectorized variant of calculate_implied_win_percentages for whole
+    snapshot columns of decimal odds.
+
+    Args:
+        odds1, odds2 (np.ndarray): Decimal odds for each side of each match.
+    Returns:
+        tuple: (win_pct_player1, win_pct_player2) ndarrays rounded to 3
+               decimals, with NaN where odds are zero.
+    """
+    odds1 = np.asarray(odds1, dtype=float)
+    odds2 = np.asarray(odds2, dtype=float)
+    prob1 = np.where(odds1 == 0, np.nan, 1.0 / np.where(odds1 == 0, 1.0, odds1))
+    prob2 = np.where(odds2 == 0, np.nan, 1.0 / np.where(odds2 == 0, 1.0, odds2))
+    total = prob1 + prob2
+    return np.round(prob1 / total, 3), np.round(prob2 / total, 3)
+
 
 # ===========================
 # Section: Name Mapping – Fuzzy Confirmation
 # Description: Prompt the user for fuzzy match confirmation and update the CSV file.
 # ===========================
+import csv
+
 def update_name_mapping_csv(new_entry, filename="name_map.csv"):
     """
     Append a new row to the name mapping CSV with:
       - name1 = standardized name,
       - name2 = scraped original name.
+    Appends a single row in place; no full read/concat/rewrite of the file.
     """
     try:
-        try:
-            df = pd.read_csv(filename)
-        except Exception:
-            df = pd.DataFrame(columns=["name1", "name2"])
-        new_row = {"name1": new_entry["mapping_standardized"],
-                   "name2": new_entry["scraped_original"]}
-        new_row_df = pd.DataFrame([new_row])
-        df = pd.concat([df, new_row_df], ignore_index=True)
-        df.to_csv(filename, index=False)
+        need_header = not os.path.exists(filename) or os.path.getsize(filename) == 0
+        with open(filename, 'a', newline='') as f:
+            writer = csv.writer(f)
+            if need_header:
+                writer.writerow(["name1", "name2"])
+            writer.writerow([new_entry["mapping_standardized"], new_entry["scraped_original"]])
         logging.info(f"Updated {filename} with new mapping: {new_entry['scraped_original']} -> {new_entry['mapping_standardized']}")
     except Exception as e:
         logging.error(f"Error updating {filename}: {e}")
@@ -181,9 +242,22 @@ def apply_name_mapping(name, name_map, score_cutoff=90):
     name_lower = normalize_name(name)
     if name_lower in name_map:
         return name_map[name_lower]["standardized"]
-    best_match = process.extractOne(name_lower, list(name_map.keys()), score_cutoff=score_cutoff)
+    # Fast-reject names that share no bigram with any key; a fuzzy match above
+    # the cutoff is impossible for them, so skip the Levenshtein scan entirely.
+    _, bigram_index = _name_map_choices(name_map)
+    candidates = set()
+    for bigram in _bigrams(name_lower):
+        candidates.update(bigram_index.get(bigram, ()))
+    if not candidates:
+        return name
+    # Queries and keys are both already normalize_name()'d, so skip
+    # rapidfuzz's per-choice preprocessing pass entirely.
+    best_match = process.extractOne(name_lower, candidates,
+                                    scorer=fuzz.WRatio,
+                                    processor=None,
+                                    score_cutoff=score_cutoff)
     if best_match:
-        matched_key, score = best_match
+        matched_key, score, _ = best_match
         mapping_info = name_map[matched_key]
         fuzzy_entry = {
             "scraped_normalized": name_lower,
@@ -199,33 +273,89 @@ def apply_name_mapping(name, name_map, score_cutoff=90):
         return mapping_info["standardized"]
     return name
 
+def resolve_name_mapping(names, name_map, score_cutoff=90):
+    """
+    Resolve a batch of scraped names to standardized names in one pass.
+    Exact normalized hits are taken directly; the remainder are scored
+    against all keys with a single process.cdist call (SIMD, multithreaded)
+    instead of one extractOne per name.
+
+    Returns:
+        dict: raw name -> standardized name (or the raw name if unmatched).
+    """
+    resolved = {}
+    unresolved = []
+    for name in set(names):
+        info = name_map.get(normalize_name(name))
+        if info:
+            resolved[name] = info["standardized"]
+        else:
+            unresolved.append(name)
+    if not unresolved:
+        return resolved
+    choices, _ = _name_map_choices(name_map)
+    if not choices:
+        resolved.update({name: name for name in unresolved})
+        return resolved
+    queries = [normalize_name(name) for name in unresolved]
+    # processor=None: both sides are pre-normalized at load/query time.
+    scores = process.cdist(queries, choices, scorer=fuzz.WRatio,
+                           processor=None,
+                           score_cutoff=score_cutoff, workers=-1)
+    best_idx = scores.argmax(axis=1)
+    for name, name_lower, row_scores, idx in zip(unresolved, queries, scores, best_idx):
+        score = row_scores[idx]
+        if score < score_cutoff:
+            resolved[name] = name
+            continue
+        matched_key = choices[idx]
+        mapping_info = name_map[matched_key]
+        FUZZY_MATCHES.append({
+            "scraped_normalized": name_lower,
+            "scraped_original": name,
+            "matched_key": matched_key,
+            "mapping_raw": mapping_info["raw"],
+            "mapping_standardized": mapping_info["standardized"],
+            "csv_row": mapping_info["row"],
+            "score": score
+        })
+        logging.info(f"Fuzzy match: Scraped '{name}' (normalized: '{name_lower}') matched with mapping CSV row {mapping_info['row']} - CSV value: '{mapping_info['raw']}' (standardized: '{mapping_info['standardized']}') (score: {score})")
+        resolved[name] = mapping_info["standardized"]
+    return resolved
+
 
 # ===========================
 # Section: Odds Calculations (continued)
 # Description: Creating unique match IDs.
 # ===========================
+@lru_cache(maxsize=4096)
 def extract_last_name(full_name):
     """
     Extract the last name from the player's name using everything before the final space.
-    
+
     Returns:
         str: The lowercase result.
     """
-    full_name = full_name.strip()
-    if " " not in full_name:
-        return full_name.lower()
-    tokens = full_name.split()
-    return " ".join(tokens[:-1]).lower()
+    # Single rfind scan; no token list allocation. Memoized since the same
+    # players recur day after day.
+    s = full_name.strip()
+    i = s.rfind(" ")
+    return s.lower() if i < 0 else s[:i].lower()
 
-def create_match_id(player1, player2, match_date_obj):
+def create_match_id(player1, player2, match_date_obj, date_str=None):
     """
     Create a match ID formatted as: {first_last}-{second_last}-{mmddyy}
+
+    Callers looping over one day's matches can pass a precomputed date_str
+    to skip the per-match strftime.
     """
     last1 = extract_last_name(player1)
     last2 = extract_last_name(player2)
-    sorted_names = sorted([last1, last2])
-    date_str = match_date_obj.strftime("%m%d%y")
-    return f"{sorted_names[0]}-{sorted_names[1]}-{date_str}"
+    # Two-element canonical ordering without a list + Timsort call.
+    first, second = (last1, last2) if last1 <= last2 else (last2, last1)
+    if date_str is None:
+        date_str = match_date_obj.strftime("%m%d%y")
+    return f"{first}-{second}-{date_str}"
 
 
 # ===========================
@@ -234,92 +364,193 @@ def create_match_id(player1, player2, match_date_obj):
 # ===========================
 import requests
 from bs4 import BeautifulSoup
-
-def scrape_tennis_matches(url, match_date, processed_matches, match_date_obj, surface_map, name_map):
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # selectolax's lexbor engine parses an order of magnitude faster than
+    # lxml-backed BeautifulSoup; BS4 stays as the fallback when it isn't
+    # installed (or for gnarlier malformed HTML).
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Shared session: one TLS handshake amortized across all scraped day-URLs,
+# with retry/backoff on transient server errors.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])))
+SESSION.mount("https://", HTTPAdapter(
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])))
+
+def _node_text(node):
+    """
+    Pull a node's text via the cheap single-text-node path when possible,
+    falling back to get_text's child walk only for nested markup.
+    """
+    s = node.string
+    return s.strip() if s is not None else node.get_text(strip=True)
+
+# Both parsers reduce the result tables to the same flat record stream so the
+# match-building logic below stays parser-agnostic:
+#   ('header', tournament_text_or_None)
+#   ('match', player1, player2, odds_text_1, odds_text_2)
+
+def _parse_result_rows_bs4(content):
+    soup = BeautifulSoup(content, 'lxml')
+    records = []
+    for match_table in soup.find_all('table', {'class': 'result'}):
+        rows = match_table.find_all('tr')
+        # Index rows by id once so companion-row lookups are O(1) instead of
+        # full-document CSS queries per row.
+        rows_by_id = {r.get('id'): r for r in rows if r.get('id')}
+        for row in rows:
+            row_classes = row.get('class', [])
+            if 'flags' in row_classes or 'head' in row_classes:
+                tournament_element = row.find('td', class_='t-name')
+                records.append(('header',
+                                _node_text(tournament_element) if tournament_element else None))
+                continue
+            row_id = row.get('id')
+            if not row_id or 'b' in row_id:
+                continue
+            result_td = row.find('td', class_='result')
+            if result_td and _node_text(result_td):
+                continue
+            # Player 1 is the anchor in this row's 2nd cell; player 2 lives in
+            # the companion '<row_id>b' row's 1st cell.
+            cells = row.find_all('td')
+            player1_element = cells[1].find('a') if len(cells) > 1 else None
+            player2_element = None
+            row_b = rows_by_id.get(row_id + 'b')
+            if row_b is not None:
+                row_b_tds = row_b.find_all('td', recursive=False)
+                if row_b_tds:
+                    player2_element = row_b_tds[0].find('a')
+            player1 = _node_text(player1_element) if player1_element else "Unknown Player"
+            player2 = _node_text(player2_element) if player2_element else "Unknown Player"
+            odds_text_1 = _node_text(cells[9]) if len(cells) > 10 else ''
+            odds_text_2 = _node_text(cells[10]) if len(cells) > 10 else ''
+            records.append(('match', player1, player2, odds_text_1, odds_text_2))
+    return records
+
+def _parse_result_rows_lexbor(content):
+    tree = LexborHTMLParser(content)
+    records = []
+    for match_table in tree.css('table.result'):
+        rows = match_table.css('tr')
+        rows_by_id = {}
+        for r in rows:
+            rid = r.attributes.get('id')
+            if rid:
+                rows_by_id[rid] = r
+        for row in rows:
+            attrs = row.attributes
+            row_classes = (attrs.get('class') or '').split()
+            if 'flags' in row_classes or 'head' in row_classes:
+                tournament_element = row.css_first('td.t-name')
+                records.append(('header',
+                                tournament_element.text(strip=True) if tournament_element is not None else None))
+                continue
+            row_id = attrs.get('id')
+            if not row_id or 'b' in row_id:
+                continue
+            result_td = row.css_first('td.result')
+            if result_td is not None and result_td.text(strip=True):
+                continue
+            cells = row.css('td')
+            player1_element = cells[1].css_first('a') if len(cells) > 1 else None
+            player2_element = None
+            row_b = rows_by_id.get(row_id + 'b')
+            if row_b is not None:
+                row_b_tds = row_b.css('td')
+                if row_b_tds:
+                    player2_element = row_b_tds[0].css_first('a')
+            player1 = player1_element.text(strip=True) if player1_element is not None else "Unknown Player"
+            player2 = player2_element.text(strip=True) if player2_element is not None else "Unknown Player"
+            odds_text_1 = cells[9].text(strip=True) if len(cells) > 10 else ''
+            odds_text_2 = cells[10].text(strip=True) if len(cells) > 10 else ''
+            records.append(('match', player1, player2, odds_text_1, odds_text_2))
+    return records
+
+_parse_result_rows = _parse_result_rows_lexbor if LexborHTMLParser is not None else _parse_result_rows_bs4
+
+def scrape_tennis_matches(url, match_date, processed_matches, match_date_obj, surface_map, name_map, session=SESSION):
     """
     Scrape tennis match data from the URL.
     Returns a list of match dictionaries.
     """
     try:
-        response = requests.get(url)
+        response = session.get(url, timeout=10)
     except Exception as e:
         logging.error(f"Request error for URL {url}: {e}")
         return []
     if response.status_code != 200:
         logging.error(f"Error: Failed to retrieve URL {url} (Status code: {response.status_code})")
         return []
-    soup = BeautifulSoup(response.text, 'html.parser')
-    match_tables = soup.find_all('table', {'class': 'result'})
     matches = []
     current_tournament = None
-    for match_table in match_tables:
-        rows = match_table.find_all('tr')
-        for row in rows:
-            row_classes = row.get('class', [])
-            if 'flags' in row_classes or 'head' in row_classes:
-                tournament_element = row.find('td', class_='t-name')
-                if tournament_element:
-                    current_tournament = tournament_element.get_text(strip=True)
-                    norm_tournament = normalize_name(current_tournament)
-                    if FILTER_LOW_LEVEL_TOURNAMENTS:
-                        if any(keyword.lower() in norm_tournament for keyword in [kw.lower() for kw in LOWER_LEVEL_KEYWORDS]):
-                            current_tournament = None
-                            continue
-                continue
-            if not current_tournament:
-                continue
-            row_id = row.get('id')
-            if not row_id or 'b' in row_id:
+    current_surface = "Unknown"
+    for record in _parse_result_rows(response.content):
+        if record[0] == 'header':
+            tournament = record[1]
+            if tournament is None:
                 continue
-            result_td = row.find('td', class_='result')
-            if result_td and result_td.get_text(strip=True):
+            current_tournament = tournament
+            norm_tournament = normalize_name(current_tournament)
+            if FILTER_LOW_LEVEL_TOURNAMENTS:
+                if any(keyword in norm_tournament for keyword in _LOWER_LEVEL_KEYWORDS_LC):
+                    current_tournament = None
+                    continue
+            # Resolve the surface once per header row; every match row
+            # under this tournament reuses it.
+            current_surface = surface_map.get(norm_tournament, "Unknown")
+            continue
+        if not current_tournament:
+            continue
+        _, player1, player2, odds_text_1, odds_text_2 = record
+        if '/' in player1 or '/' in player2:
+            continue
+        match_identifier = tuple(sorted([player1, player2]))
+        if match_identifier in processed_matches:
+            continue
+        processed_matches.add(match_identifier)
+        if odds_text_1 and odds_text_2:
+            try:
+                moneyline_odds_player1 = float(odds_text_1)
+                moneyline_odds_player2 = float(odds_text_2)
+            except ValueError:
                 continue
-            player1_selector = f"#{row_id} > td:nth-child(2) > a:nth-child(1)"
-            player2_selector = f"#{row_id}b > td:nth-child(1) > a:nth-child(1)"
-            player1_element = soup.select_one(player1_selector)
-            player2_element = soup.select_one(player2_selector)
-            player1 = player1_element.get_text(strip=True) if player1_element else "Unknown Player"
-            player2 = player2_element.get_text(strip=True) if player2_element else "Unknown Player"
-            if '/' in player1 or '/' in player2:
+            win_pct1, win_pct2 = calculate_implied_win_percentages(moneyline_odds_player1, moneyline_odds_player2)
+            if win_pct1 is None or win_pct2 is None:
                 continue
-            match_identifier = tuple(sorted([player1, player2]))
-            if match_identifier in processed_matches:
-                continue
-            processed_matches.add(match_identifier)
-            cells = row.find_all('td')
-            if len(cells) > 10:
-                odds_text_1 = cells[9].get_text(strip=True)
-                odds_text_2 = cells[10].get_text(strip=True)
-                if odds_text_1 and odds_text_2:
-                    try:
-                        moneyline_odds_player1 = float(odds_text_1)
-                        moneyline_odds_player2 = float(odds_text_2)
-                    except ValueError:
-                        continue
-                    win_pct1, win_pct2 = calculate_implied_win_percentages(moneyline_odds_player1, moneyline_odds_player2)
-                    if win_pct1 is None or win_pct2 is None:
-                        continue
-                    norm_tournament = normalize_name(current_tournament)
-                    surface = surface_map.get(norm_tournament, "Unknown")
-                    if surface == "Unknown":
-                        UNMAPPED_SURFACE_MATCHES.append(current_tournament)
-                    player1_raw = player1
-                    player2_raw = player2
-                    standardized_player1 = apply_name_mapping(player1, name_map)
-                    standardized_player2 = apply_name_mapping(player2, name_map)
-                    match_data = {
-                        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        'date': match_date,
-                        'tournament': current_tournament,
-                        'surface': surface,
-                        'player1': standardized_player1,
-                        'player1_raw': player1_raw,
-                        'player2': standardized_player2,
-                        'player2_raw': player2_raw,
-                        'implied_win_pct_player1': win_pct1,
-                        'implied_win_pct_player2': win_pct2
-                    }
-                    matches.append(match_data)
+            surface = current_surface
+            if surface == "Unknown":
+                UNMAPPED_SURFACE_MATCHES.append(current_tournament)
+            match_data = {
+                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'date': match_date,
+                'tournament': current_tournament,
+                'surface': surface,
+                'player1_raw': player1,
+                'player2_raw': player2,
+                # Normalized forms cached here so the summary pass
+                # doesn't re-normalize every name.
+                'p1_norm_raw': normalize_name(player1),
+                'p2_norm_raw': normalize_name(player2),
+                'implied_win_pct_player1': win_pct1,
+                'implied_win_pct_player2': win_pct2
+            }
+            matches.append(match_data)
+    # Standardize all names for the day in one batched cdist pass rather
+    # than per-name extractOne calls inside the row loop.
+    all_names = [m['player1_raw'] for m in matches] + [m['player2_raw'] for m in matches]
+    resolved = resolve_name_mapping(all_names, name_map)
+    for match in matches:
+        match['player1'] = resolved[match['player1_raw']]
+        match['player2'] = resolved[match['player2_raw']]
+        match['p1_norm_std'] = normalize_name(match['player1'])
+        match['p2_norm_std'] = normalize_name(match['player2'])
     return matches
 
 
@@ -327,28 +558,45 @@ def scrape_tennis_matches(url, match_date, processed_matches, match_date_obj, su
 # Section: Data Preparation
 # Description: Prepares daily DataFrames from the scraped match data.
 # ===========================
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
 def prepare_daily_dataframes(surface_map, name_map):
     """
-    For each day, fetch match data and convert it to a DataFrame.
+    Fetch match data for each day concurrently and convert it to DataFrames.
     Returns a tuple: (daily_dataframes, successful_match_count, total_match_count)
     """
     today = datetime.today()
-    processed_matches = set()
     daily_dataframes = {}
     successful_match_count = 0
     total_match_count = 0
-    for i in range(MATCHES_TO_SCRAPE):
+
+    def _scrape_day(i):
         day = today + timedelta(days=i)
         match_date = day.strftime("%Y-%m-%d")
         url = URL_TEMPLATE.format(year=day.year, month=day.month, day=day.day)
         logging.info(f"Fetching data for {match_date} from URL: {url}")
-        day_matches = scrape_tennis_matches(url, match_date, processed_matches, day, surface_map, name_map)
+        # Each day gets its own processed set; cross-day duplicates are
+        # removed in order below, so no lock is needed across threads.
+        return match_date, day, scrape_tennis_matches(url, match_date, set(), day, surface_map, name_map)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        day_results = list(executor.map(_scrape_day, range(MATCHES_TO_SCRAPE)))
+
+    processed_matches = set()
+    for match_date, day, day_matches in day_results:
+        deduped = []
+        for match in day_matches:
+            match_identifier = tuple(sorted([match['player1_raw'], match['player2_raw']]))
+            if match_identifier in processed_matches:
+                continue
+            processed_matches.add(match_identifier)
+            deduped.append(match)
+        day_matches = deduped
         total_match_count += len(day_matches)
         for match in day_matches:
-            if (normalize_name(match['player1_raw']) != normalize_name(match['player1']) and
-                normalize_name(match['player2_raw']) != normalize_name(match['player2']) and
+            if (match['p1_norm_raw'] != match['p1_norm_std'] and
+                match['p2_norm_raw'] != match['p2_norm_std'] and
                 match['surface'] != "Unknown"):
                 successful_match_count += 1
         if not day_matches:
@@ -357,37 +605,41 @@ def prepare_daily_dataframes(surface_map, name_map):
                 'player', 'opponent', 'player win%', 'opponent win%'
             ])
             continue
-        rows = []
+        # Build column arrays directly (each match contributes two rows:
+        # player1's view and player2's view) and construct the frame once;
+        # avoids allocating two string-keyed dicts per match.
+        match_ids = []
+        snapshot_times = []
+        dates = []
+        tournaments = []
+        surfaces = []
+        players = []
+        opponents = []
+        player_pcts = []
+        opponent_pcts = []
+        day_str = day.strftime("%m%d%y")
         for match in day_matches:
-            match_id = create_match_id(match['player1'], match['player2'], day)
-            snapshot_time = match['timestamp']
-            row1 = {
-                'match_id': match_id,
-                'snapshot_time': snapshot_time,
-                'date': match['date'],
-                'tournament': match['tournament'],
-                'surface': match['surface'],
-                'player': match['player1'],
-                'opponent': match['player2'],
-                'player win%': match['implied_win_pct_player1'],
-                'opponent win%': match['implied_win_pct_player2']
-            }
-            row2 = {
-                'match_id': match_id,
-                'snapshot_time': snapshot_time,
-                'date': match['date'],
-                'tournament': match['tournament'],
-                'surface': match['surface'],
-                'player': match['player2'],
-                'opponent': match['player1'],
-                'player win%': match['implied_win_pct_player2'],
-                'opponent win%': match['implied_win_pct_player1']
-            }
-            rows.extend([row1, row2])
-        daily_df = pd.DataFrame(rows, columns=[
-            'match_id', 'snapshot_time', 'date', 'tournament', 'surface',
-            'player', 'opponent', 'player win%', 'opponent win%'
-        ])
+            match_id = create_match_id(match['player1'], match['player2'], day, date_str=day_str)
+            match_ids += [match_id, match_id]
+            snapshot_times += [match['timestamp'], match['timestamp']]
+            dates += [match['date'], match['date']]
+            tournaments += [match['tournament'], match['tournament']]
+            surfaces += [match['surface'], match['surface']]
+            players += [match['player1'], match['player2']]
+            opponents += [match['player2'], match['player1']]
+            player_pcts += [match['implied_win_pct_player1'], match['implied_win_pct_player2']]
+            opponent_pcts += [match['implied_win_pct_player2'], match['implied_win_pct_player1']]
+        daily_df = pd.DataFrame({
+            'match_id': match_ids,
+            'snapshot_time': snapshot_times,
+            'date': dates,
+            'tournament': tournaments,
+            'surface': surfaces,
+            'player': players,
+            'opponent': opponents,
+            'player win%': player_pcts,
+            'opponent win%': opponent_pcts
+        }, copy=False)
         daily_dataframes[match_date] = daily_df
     return daily_dataframes, successful_match_count, total_match_count
 
@@ -404,6 +656,14 @@ def save_to_db(daily_dataframes, db_filename="odds.db"):
     """
     conn = sqlite3.connect(db_filename)
     cursor = conn.cursor()
+    # Bulk-load pragmas: WAL + relaxed syncs cut per-transaction fsyncs, and
+    # in-memory temp store / larger page cache (64MB) reduce disk churn.
+    cursor.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-64000;
+    """)
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS odds_snapshots (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -419,24 +679,19 @@ def save_to_db(daily_dataframes, db_filename="odds.db"):
         )
     """)
     conn.commit()
+    insert_columns = ['match_id', 'snapshot_time', 'date', 'tournament', 'surface',
+                      'player', 'opponent', 'player win%', 'opponent win%']
+    # Single explicit transaction around all days' inserts.
+    conn.execute("BEGIN")
     for match_date, df in daily_dataframes.items():
         if df.empty:
             continue
-        for _, row in df.iterrows():
-            cursor.execute("""
-                INSERT INTO odds_snapshots (match_id, snapshot_time, date, tournament, surface, player, opponent, player_win_pct, opponent_win_pct)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                row['match_id'],
-                row['snapshot_time'],
-                row['date'],
-                row['tournament'],
-                row['surface'],
-                row['player'],
-                row['opponent'],
-                row['player win%'],
-                row['opponent win%']
-            ))
+        # One executemany over raw tuples per day instead of an iterrows()
+        # loop with a statement dispatch per row.
+        cursor.executemany("""
+            INSERT INTO odds_snapshots (match_id, snapshot_time, date, tournament, surface, player, opponent, player_win_pct, opponent_win_pct)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, df[insert_columns].itertuples(index=False, name=None))
     conn.commit()
     conn.close()
     logging.info(f"Snapshot data saved to database '{db_filename}'.")
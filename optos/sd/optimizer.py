@@ -1,10 +1,12 @@
 # optimizer.py
 
+import os
+import numpy as np
 import pandas as pd
-import random
 import logging
 import sys
 from pulp import (
+    LpAffineExpression,
     LpProblem,
     LpMaximize,
     LpVariable,
@@ -13,6 +15,38 @@ from pulp import (
     PULP_CBC_CMD,
 )
 from collections import defaultdict
+from multiprocessing import Pool
+
+try:
+    # HiGHS links in-process through highspy, so each solve skips the LP-file
+    # write, cbc fork/exec, and .sol parse that PULP_CBC_CMD pays per call —
+    # which dominates wall time on these tiny showdown models.
+    import highspy  # noqa: F401
+    from pulp import HiGHS
+    _HAS_HIGHS = True
+except ImportError:
+    _HAS_HIGHS = False
+
+def _make_solver():
+    """Return the fastest available PuLP solver, preferring in-process HiGHS."""
+    if _HAS_HIGHS:
+        return HiGHS(msg=False)
+    # CBC fallback: let it branch on all cores, accept a 0.1% optimality gap
+    # (well under projection noise), and reuse the previous lineup's solution
+    # as a MIP start so each re-solve begins from a near-feasible point.
+    solver = PULP_CBC_CMD(
+        msg=False,
+        threads=os.cpu_count(),
+        warmStart=True,
+        keepFiles=False,
+        options=["ratioGap", "0.001"],
+    )
+    # PuLP round-trips the model through .lp/.sol files for CBC; pointing its
+    # temp dir at tmpfs keeps that I/O in memory, which on these tiny models
+    # costs more than the solve itself.
+    if os.path.isdir("/dev/shm"):
+        solver.tmpDir = "/dev/shm"
+    return solver
 
 # Include the get_logger function and necessary settings
 DEBUG = True
@@ -43,6 +77,101 @@ def get_logger(name):
 
 logger = get_logger(__name__)
 
+# Shared PCG64 generator: one vectorized draw per variance pass, and seedable
+# in one place for reproducible lineup runs.
+_RNG = np.random.default_rng()
+
+def _build_lineup_model(df_showdown, salary_cap, COLUMN_CONFIG):
+    """
+    Build the decision variables and structural showdown constraints (salary
+    cap, one captain, five flex, per-name uniqueness). The objective and any
+    cross-lineup rows are added by the caller.
+
+    Returns:
+        tuple: (problem, positions_vars, players, player_vars)
+    """
+    players = df_showdown["player_id"].tolist()
+    logger.debug("Number of players: %s", len(players))
+
+    # Create decision variables
+    positions_vars = {player: LpVariable(f"{player}_pos", cat="Binary") for player in players}
+    logger.debug("Created decision variables for players.")
+
+    # Initialize optimization problem
+    problem = LpProblem("Showdown_Lineups", LpMaximize)
+    logger.debug("Initialized optimization problem.")
+
+    # Pull coefficient columns out as plain ndarrays once; df.loc[j, col]
+    # label indexing costs dozens of Python calls per access.
+    player_vars = [positions_vars[player] for player in players]
+    salaries = df_showdown[COLUMN_CONFIG['salary']].to_numpy()
+
+    # Constraint: Salary cap
+    problem += (
+        LpAffineExpression(zip(player_vars, salaries.tolist())) <= salary_cap,
+        "Salary_Cap"
+    )
+    logger.debug("Added salary cap constraint.")
+
+    # No explicit roster-size row: exactly one captain plus exactly five flex
+    # already force six players, and the redundant constraint just gives CBC
+    # presolve extra work.
+
+    # Group player_ids by role and by name straight from the frame instead of
+    # re-scanning every id with startswith/endswith per group.
+    role_col = COLUMN_CONFIG['role']
+    captain_ids = df_showdown.loc[df_showdown[role_col] == 'Captain', 'player_id'].tolist()
+    flex_ids = df_showdown.loc[df_showdown[role_col] == 'Flex', 'player_id'].tolist()
+    name_to_ids = df_showdown.groupby(COLUMN_CONFIG['name'])['player_id'].apply(list).to_dict()
+
+    # Constraint: Exactly one Captain
+    problem += (
+        lpSum(positions_vars[player] for player in captain_ids) == 1,
+        "One_Captain"
+    )
+    logger.debug("Added Captain role constraint.")
+
+    # Constraint: Exactly five Flex players
+    problem += (
+        lpSum(positions_vars[player] for player in flex_ids) == 5,
+        "Five_Flex"
+    )
+    logger.debug("Added Flex role constraint.")
+
+    # Constraint: Unique players (no duplicate players in lineup)
+    for name, variant_ids in name_to_ids.items():
+        problem += (
+            lpSum(positions_vars[player] for player in variant_ids) <= 1,
+            f"Unique_Player_{name}"
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Added unique player constraint for %s.", name)
+
+    return problem, positions_vars, players, player_vars
+
+def _solve_one_lineup(args):
+    """
+    Pool worker: build and solve a single independent lineup with its own
+    seeded variance draw. Module-level so it pickles for multiprocessing.
+    """
+    (df_showdown, projection_column, salary_cap, COLUMN_CONFIG,
+     player_correlations, apply_variance_flag, seed) = args
+    global _RNG
+    _RNG = np.random.default_rng(seed)
+
+    problem, positions_vars, players, player_vars = _build_lineup_model(
+        df_showdown, salary_cap, COLUMN_CONFIG)
+    if apply_variance_flag:
+        projections = apply_variance_to_projections(
+            df_showdown, player_correlations, projection_column, COLUMN_CONFIG).to_numpy()
+    else:
+        projections = df_showdown[projection_column].to_numpy()
+    problem.setObjective(LpAffineExpression(zip(player_vars, projections.tolist())))
+    problem.solve(_make_solver())
+    if LpStatus[problem.status] == "Optimal":
+        return [player for player in players if positions_vars[player].varValue == 1]
+    return None
+
 def optimize_lineups(optimizer_config, progress_bar=None, status_text=None):
     """
     Generates optimized lineups based on provided configurations.
@@ -57,7 +186,7 @@ def optimize_lineups(optimizer_config, progress_bar=None, status_text=None):
     """
     logger.debug("Starting optimize_lineups function.")
     df_showdown = optimizer_config["df"].copy()
-    logger.debug(f"Initial df_showdown shape: {df_showdown.shape}")
+    logger.debug("Initial df_showdown shape: %s", df_showdown.shape)
 
     # Extract optimization parameters
     num_lineups = optimizer_config["num_lineups"]
@@ -69,12 +198,12 @@ def optimize_lineups(optimizer_config, progress_bar=None, status_text=None):
     COLUMN_CONFIG = optimizer_config["COLUMN_CONFIG"]
     min_unique_players = optimizer_config.get("min_unique_players", 1)
 
-    logger.debug(f"Number of lineups to generate: {num_lineups}")
-    logger.debug(f"Salary cap: {salary_cap}")
-    logger.debug(f"Projection column: {projection_column}")
-    logger.debug(f"Apply variance flag: {apply_variance_flag}")
-    logger.debug(f"Mode: {mode.capitalize()}")
-    logger.debug(f"Minimum unique players between lineups: {min_unique_players}")
+    logger.debug("Number of lineups to generate: %s", num_lineups)
+    logger.debug("Salary cap: %s", salary_cap)
+    logger.debug("Projection column: %s", projection_column)
+    logger.debug("Apply variance flag: %s", apply_variance_flag)
+    logger.debug("Mode: %s", mode.capitalize())
+    logger.debug("Minimum unique players between lineups: %s", min_unique_players)
 
     # Reset index to ensure alignment
     df_showdown.reset_index(drop=True, inplace=True)
@@ -92,7 +221,7 @@ def optimize_lineups(optimizer_config, progress_bar=None, status_text=None):
     ]
     missing_columns = [col for col in required_columns if col not in df_showdown.columns]
     if missing_columns:
-        logger.error(f"Missing required columns in df_showdown: {missing_columns}")
+        logger.error("Missing required columns in df_showdown: %s", missing_columns)
         sys.exit(f"Error: Missing required columns in data: {missing_columns}")
 
     # Create 'player_id' by combining 'name' and 'role' if not already present
@@ -101,13 +230,38 @@ def optimize_lineups(optimizer_config, progress_bar=None, status_text=None):
         logger.debug("Created 'player_id' column.")
 
     roster_size = 6
-    logger.debug(f"Roster size set to: {roster_size}")
+    logger.debug("Roster size set to: %s", roster_size)
+
+    # With min_unique_players == 0 there is no cross-lineup constraint, so
+    # each (variance-perturbed) lineup is an independent solve — farm them
+    # out one per process.
+    if min_unique_players == 0 and num_lineups > 1:
+        seeds = _RNG.integers(0, 2**32, size=num_lineups)
+        worker_args = [
+            (df_showdown, projection_column, salary_cap, COLUMN_CONFIG,
+             player_correlations, apply_variance_flag, int(seed))
+            for seed in seeds
+        ]
+        with Pool(min(num_lineups, os.cpu_count())) as pool:
+            results = pool.map(_solve_one_lineup, worker_args)
+        lineups = [lineup for lineup in results if lineup is not None]
+        logger.debug("Completed optimize_lineups function (parallel path).")
+        return lineups
 
     lineups = []
-    solver = PULP_CBC_CMD(msg=False)
+    solver = _make_solver()
+
+    # Build the model once. The variables and structural constraints (salary,
+    # roster size, roles, per-name uniqueness) are identical for every lineup;
+    # only the objective coefficients (variance) and the min-unique rows change
+    # between iterations, so rebuilding the whole LpProblem per lineup was
+    # pure overhead.
+    problem, positions_vars, players, player_vars = _build_lineup_model(
+        df_showdown, salary_cap, COLUMN_CONFIG)
+    base_projections = df_showdown[projection_column].to_numpy()
 
     for i in range(num_lineups):
-        logger.debug(f"Generating lineup {i + 1}/{num_lineups}.")
+        logger.debug("Generating lineup %d/%d.", i + 1, num_lineups)
 
         # Update progress bar
         if progress_bar is not None:
@@ -120,95 +274,162 @@ def optimize_lineups(optimizer_config, progress_bar=None, status_text=None):
 
         if apply_variance_flag:
             logger.debug("Applying variance to projections.")
-            df_current = apply_variance_to_projections(df_showdown, player_correlations, projection_column, COLUMN_CONFIG)
+            projections = apply_variance_to_projections(
+                df_showdown, player_correlations, projection_column, COLUMN_CONFIG).to_numpy()
         else:
-            df_current = df_showdown.copy()
+            projections = base_projections
             logger.debug("Not applying variance to projections.")
 
-        df_current = df_current.reset_index(drop=True)
-
-        players = df_current["player_id"].tolist()
-        logger.debug(f"Number of players: {len(players)}")
-
-        # Create decision variables
-        positions_vars = {player: LpVariable(f"{player}_pos_{i}", cat="Binary") for player in players}
-        logger.debug("Created decision variables for players.")
-
-        # Initialize optimization problem
-        problem = LpProblem(f"Showdown_Lineup_{i+1}", LpMaximize)
-        logger.debug(f"Initialized optimization problem for lineup {i + 1}.")
-
-        # Objective: Maximize total projections
-        problem += lpSum(
-            df_current.loc[j, projection_column] * positions_vars[players[j]] for j in range(len(players))
-        ), "Total_Projected_Points"
+        # Objective: Maximize total projections. Swapped in place on the
+        # persistent model rather than rebuilding it; building the
+        # LpAffineExpression straight from (var, coef) pairs also skips
+        # lpSum's pure-Python reduction.
+        problem.setObjective(LpAffineExpression(zip(player_vars, projections.tolist())))
         logger.debug("Set objective to maximize total projected points.")
 
-        # Constraint: Salary cap
-        problem += (
-            lpSum(
-                df_current.loc[j, COLUMN_CONFIG['salary']] * positions_vars[players[j]] for j in range(len(players))
-            ) <= salary_cap,
-            "Salary_Cap"
-        )
-        logger.debug("Added salary cap constraint.")
-
-        # Constraint: Roster size
-        problem += (
-            lpSum(positions_vars[player] for player in players) == roster_size,
-            "Roster_Size"
-        )
-        logger.debug("Added roster size constraint.")
-
-        # Constraint: Exactly one Captain
-        problem += (
-            lpSum(positions_vars[player] for player in players if player.endswith("|Captain")) == 1,
-            "One_Captain"
-        )
-        logger.debug("Added Captain role constraint.")
-
-        # Constraint: Exactly five Flex players
-        problem += (
-            lpSum(positions_vars[player] for player in players if player.endswith("|Flex")) == 5,
-            "Five_Flex"
-        )
-        logger.debug("Added Flex role constraint.")
-
-        # Constraint: Unique players (no duplicate players in lineup)
-        for name in df_current[COLUMN_CONFIG['name']].unique():
-            player_variants = [player for player in players if player.startswith(name + "|")]
-            problem += (
-                lpSum(positions_vars[player] for player in player_variants) <= 1,
-                f"Unique_Player_{name}"
-            )
-            logger.debug(f"Added unique player constraint for {name}.")
-
-        # Constraint: Minimum unique players between lineups
-        for j, existing_lineup in enumerate(lineups):
-            overlap = lpSum(positions_vars[player] for player in existing_lineup)
+        # Constraint: Minimum unique players vs. the previous lineup. Rows
+        # for earlier lineups persist on the model, so only one new row is
+        # needed per iteration.
+        if lineups:
+            overlap = lpSum(positions_vars[player] for player in lineups[-1])
             problem += (
                 overlap <= roster_size - min_unique_players,
-                f"Min_Unique_Players_Constraint_{i+1}_{j+1}"
+                f"Min_Unique_Players_Constraint_{i+1}"
             )
-            logger.debug(f"Added minimum unique players constraint between lineup {i + 1} and lineup {j + 1}.")
+            logger.debug("Added minimum unique players constraint for lineup %d.", i + 1)
 
         # Solve the optimization problem
-        logger.debug(f"Solving optimization problem for lineup {i + 1}.")
+        logger.debug("Solving optimization problem for lineup %d.", i + 1)
         problem.solve(solver)
-        logger.debug(f"Optimization Status: {LpStatus[problem.status]}")
+        logger.debug("Optimization Status: %s", LpStatus[problem.status])
 
         if LpStatus[problem.status] == "Optimal":
             selected_lineup = [player for player in players if positions_vars[player].varValue == 1]
-            logger.debug(f"Selected lineup {i + 1}: {selected_lineup}")
+            logger.debug("Selected lineup %d: %s", i + 1, selected_lineup)
             lineups.append(selected_lineup)
-            logger.debug(f"Lineup {i + 1} generated successfully.")
+            logger.debug("Lineup %d generated successfully.", i + 1)
         else:
-            logger.warning(f"No optimal solution found for lineup {i + 1}.")
+            logger.warning("No optimal solution found for lineup %d.", i + 1)
             break
 
     logger.debug("Completed optimize_lineups function.")
     return lineups
 
+def optimize_lineups_batch(optimizer_config):
+    """
+    Generates all lineups in a single MIP instead of num_lineups sequential
+    solves: one binary x[p, k] per player and lineup copy, per-copy
+    salary/role/uniqueness constraints, and linearized pairwise-overlap rows
+    enforcing min_unique_players between every pair of copies. CBC shares
+    presolve and branching across the copies, which beats sequential solves
+    for small lineup counts; the pairwise overlap variables grow
+    O(players x num_lineups^2), so the sequential optimize_lineups remains
+    the default for large runs.
+
+    Parameters:
+        optimizer_config (dict): Same configuration dict as optimize_lineups.
+
+    Returns:
+        list: A list of optimized lineups.
+    """
+    logger.debug("Starting optimize_lineups_batch function.")
+    df_showdown = optimizer_config["df"].copy()
+    df_showdown.reset_index(drop=True, inplace=True)
+
+    num_lineups = optimizer_config["num_lineups"]
+    salary_cap = optimizer_config["salary_cap"]
+    projection_column = optimizer_config["projection_column"]
+    player_correlations = optimizer_config.get("player_correlations", {})
+    apply_variance_flag = optimizer_config.get("apply_variance", False)
+    COLUMN_CONFIG = optimizer_config["COLUMN_CONFIG"]
+    min_unique_players = optimizer_config.get("min_unique_players", 1)
+    roster_size = 6
+
+    if 'player_id' not in df_showdown.columns:
+        df_showdown["player_id"] = df_showdown[COLUMN_CONFIG['name']].astype(str) + "|" + df_showdown[COLUMN_CONFIG['role']]
+
+    players = df_showdown["player_id"].tolist()
+    salaries = df_showdown[COLUMN_CONFIG['salary']].to_numpy()
+    role_col = COLUMN_CONFIG['role']
+    captain_ids = set(df_showdown.loc[df_showdown[role_col] == 'Captain', 'player_id'])
+    flex_ids = set(df_showdown.loc[df_showdown[role_col] == 'Flex', 'player_id'])
+    name_to_ids = df_showdown.groupby(COLUMN_CONFIG['name'])['player_id'].apply(list).to_dict()
+
+    problem = LpProblem("Showdown_Lineups_Batch", LpMaximize)
+    x = {
+        (player, k): LpVariable(f"x_{j}_{k}", cat="Binary")
+        for j, player in enumerate(players)
+        for k in range(num_lineups)
+    }
+
+    # Objective: each copy gets its own (optionally variance-perturbed)
+    # projection vector.
+    objective_terms = []
+    for k in range(num_lineups):
+        if apply_variance_flag:
+            projs = apply_variance_to_projections(
+                df_showdown, player_correlations, projection_column, COLUMN_CONFIG).to_numpy()
+        else:
+            projs = df_showdown[projection_column].to_numpy()
+        objective_terms.extend((x[player, k], float(projs[j])) for j, player in enumerate(players))
+    problem += LpAffineExpression(objective_terms), "Total_Projected_Points"
+
+    # Per-copy structural constraints.
+    for k in range(num_lineups):
+        problem += (
+            LpAffineExpression([(x[player, k], float(salaries[j])) for j, player in enumerate(players)]) <= salary_cap,
+            f"Salary_Cap_{k}"
+        )
+        problem += (
+            lpSum(x[player, k] for player in players if player in captain_ids) == 1,
+            f"One_Captain_{k}"
+        )
+        problem += (
+            lpSum(x[player, k] for player in players if player in flex_ids) == 5,
+            f"Five_Flex_{k}"
+        )
+        for name, variant_ids in name_to_ids.items():
+            problem += (
+                lpSum(x[player, k] for player in variant_ids) <= 1,
+                f"Unique_Player_{name}_{k}"
+            )
+
+    # Pairwise min-unique: y[p, k1, k2] >= x[p, k1] + x[p, k2] - 1 forces y on
+    # when both copies roster the player, and capping sum(y) bounds overlap.
+    if min_unique_players > 0:
+        for k1 in range(num_lineups):
+            for k2 in range(k1 + 1, num_lineups):
+                overlap_vars = []
+                for j, player in enumerate(players):
+                    y = LpVariable(f"y_{j}_{k1}_{k2}", cat="Binary")
+                    problem += (y >= x[player, k1] + x[player, k2] - 1, f"Overlap_{j}_{k1}_{k2}")
+                    overlap_vars.append(y)
+                problem += (
+                    lpSum(overlap_vars) <= roster_size - min_unique_players,
+                    f"Min_Unique_{k1}_{k2}"
+                )
+
+    # Symmetry breaking: without per-copy variance the copies are
+    # interchangeable, so order them by objective value.
+    if not apply_variance_flag:
+        projs = df_showdown[projection_column].to_numpy()
+        for k in range(num_lineups - 1):
+            obj_k = LpAffineExpression([(x[player, k], float(projs[j])) for j, player in enumerate(players)])
+            obj_next = LpAffineExpression([(x[player, k + 1], float(projs[j])) for j, player in enumerate(players)])
+            problem += (obj_k >= obj_next, f"Symmetry_{k}")
+
+    problem.solve(_make_solver())
+    logger.debug("Batch optimization status: %s", LpStatus[problem.status])
+    if LpStatus[problem.status] != "Optimal":
+        logger.warning("No optimal solution found for batch lineup problem.")
+        return []
+
+    lineups = []
+    for k in range(num_lineups):
+        lineups.append([player for player in players if x[player, k].varValue == 1])
+    logger.debug("Completed optimize_lineups_batch function.")
+    return lineups
+
 def apply_variance_to_projections(df_showdown, player_correlations, projection_column, COLUMN_CONFIG):
     """
     Applies variance to player projections, considering negative correlations
@@ -221,95 +442,31 @@ def apply_variance_to_projections(df_showdown, player_correlations, projection_c
         COLUMN_CONFIG (dict): Dictionary containing column configurations.
 
     Returns:
-        pd.DataFrame: DataFrame with adjusted projections.
+        pd.Series: Adjusted projections, aligned with df_showdown's index.
     """
     logger.debug("Starting apply_variance_to_projections function.")
 
-    df_variance = df_showdown.copy()
-    adjusted_players = set()
-    team_variance_factors = {}  # Store variance factors for each team
     defense_positions = ['DST', 'Defense', 'D', 'D/ST']  # Adjust based on your data
 
-    # Map team to opponent
-    team_opponent_map = dict(zip(df_variance[COLUMN_CONFIG['team']], df_variance[COLUMN_CONFIG['opponent']]))
-
-    for idx, row in df_showdown.iterrows():
-        player_name = row[COLUMN_CONFIG['name']]
-        position = row[COLUMN_CONFIG['position']]
-        team = row[COLUMN_CONFIG['team']]
-        opponent = row[COLUMN_CONFIG['opponent']]
-
-        if player_name in adjusted_players:
-            continue
-
-        is_defense = position in defense_positions
-
-        if not is_defense:
-            # Offensive player
-            if team not in team_variance_factors:
-                variance_factor = random.uniform(0.9, 1.1)
-                team_variance_factors[team] = variance_factor
-            else:
-                variance_factor = team_variance_factors[team]
-
-            adjusted_players.add(player_name)
-
-            # Apply variance to offensive player
-            for role_variant in ['Flex', 'Captain']:
-                player_id_variant = f"{player_name}|{role_variant}"
-                df_variance.loc[df_variance['player_id'] == player_id_variant, projection_column] *= variance_factor
-
-            # Apply inverse variance to opposing defense
-            inverse_variance_factor = 2 - variance_factor  # Inverse of variance_factor
-            opponent_defense = df_variance[
-                (df_variance[COLUMN_CONFIG['team']] == opponent) &
-                (df_variance[COLUMN_CONFIG['position']].isin(defense_positions))
-            ]
-
-            for idx_def, def_row in opponent_defense.iterrows():
-                def_player_name = def_row[COLUMN_CONFIG['name']]
-                if def_player_name in adjusted_players:
-                    continue
-                adjusted_players.add(def_player_name)
-                for role_variant in ['Flex', 'Captain']:
-                    def_player_id_variant = f"{def_player_name}|{role_variant}"
-                    df_variance.loc[df_variance['player_id'] == def_player_id_variant, projection_column] *= inverse_variance_factor
-
-        else:
-            # Defensive player
-            if team not in team_variance_factors:
-                # If variance factor not set for defense team, set it now
-                variance_factor = random.uniform(0.9, 1.1)
-                team_variance_factors[team] = variance_factor
-            else:
-                variance_factor = team_variance_factors[team]
-
-            adjusted_players.add(player_name)
-
-            # Apply variance to defense player
-            for role_variant in ['Flex', 'Captain']:
-                player_id_variant = f"{player_name}|{role_variant}"
-                df_variance.loc[df_variance['player_id'] == player_id_variant, projection_column] *= variance_factor
-
-            # Apply inverse variance to opposing offensive players
-            inverse_variance_factor = 2 - variance_factor
-            opponent_offense = df_variance[
-                (df_variance[COLUMN_CONFIG['team']] == opponent) &
-                (~df_variance[COLUMN_CONFIG['position']].isin(defense_positions))
-            ]
-
-            for idx_off, off_row in opponent_offense.iterrows():
-                off_player_name = off_row[COLUMN_CONFIG['name']]
-                if off_player_name in adjusted_players:
-                    continue
-                adjusted_players.add(off_player_name)
-                for role_variant in ['Flex', 'Captain']:
-                    off_player_id_variant = f"{off_player_name}|{role_variant}"
-                    df_variance.loc[df_variance['player_id'] == off_player_id_variant, projection_column] *= inverse_variance_factor
-
-    logger.debug("Completed apply_variance_to_projections function.")
-    return df_variance
+    team_col = COLUMN_CONFIG['team']
+    opp_col = COLUMN_CONFIG['opponent']
+    pos_col = COLUMN_CONFIG['position']
+
+    # One factor per team, broadcast to every row at once: offensive players
+    # scale by their own team's factor, defenses by the inverse of the
+    # opposing offense's factor (negative correlation). This replaces the
+    # per-row iterrows loop with its O(N^2) boolean-mask .loc writes. Only
+    # the projection column is materialized — callers just need the adjusted
+    # coefficients, so no whole-frame copy per lineup.
+    teams = df_showdown[team_col].unique()
+    factors = pd.Series(_RNG.uniform(0.9, 1.1, len(teams)), index=teams)
+
+    is_defense = df_showdown[pos_col].isin(defense_positions)
+    multiplier = df_showdown[team_col].map(factors).where(
+        ~is_defense, 2 - df_showdown[opp_col].map(factors)
+    )
+    adjusted = df_showdown[projection_column] * multiplier
 
     logger.debug("Completed apply_variance_to_projections function.")
-    return df_variance
+    return adjusted
 
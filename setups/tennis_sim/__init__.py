@@ -3,7 +3,21 @@ tennis_sim package: Contains simulation components for tennis matches.
 """
 
 from .player import TennisPlayer
-from .serve import ServeSimulator
+from .serve import ServeSimulator, make_serve_fn
 from .rally import RallySimulator
 from .point import PointSimulator
-from .expected import compute_expected_outcomes
+from .expected import (
+    compute_expected_outcomes,
+    compute_expected_outcomes_batch,
+    compute_expected_outcomes_matrix,
+)
+from .fast import (
+    stats_array,
+    players_table,
+    elo_factor,
+    simulate_point_fast,
+    simulate_n_points,
+    simulate_batch,
+    simulate_batch_players,
+    simulate_batch_parallel,
+)
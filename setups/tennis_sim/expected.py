@@ -4,17 +4,57 @@ This module calculates the expected (base) outcome percentages for a serving pla
 using a weighted rally-length distribution and adjustments.
 """
 
+from functools import lru_cache
+
+import numpy as np
+
+from .fast import (
+    ACE_1ST,
+    ACE_2ND,
+    ACE_AGAINST,
+    DOUBLE_FAULT,
+    FIRST_SERVE_IN,
+    RALLY_10PLUS,
+    RALLY_1_3,
+    RALLY_4_6,
+    RALLY_7_9,
+    RETURN_RIPW,
+    SNV_FREQ,
+    SNV_WIN,
+)
+
+# Column order of compute_expected_outcomes_batch rows (matches the keys of
+# the scalar function's dict).
+EXPECTED_COLUMNS = (
+    'Aces',
+    'Double Faults',
+    'Serve & Volley Wins',
+    'Serve & Volley Losses',
+    'Points Won on Serve',
+    'Rally Wins as Server',
+)
+
 def compute_expected_outcomes(server, receiver):
-    stats = server.stats
-    elo_factor = 1 + 0.05 * ((server.elo - receiver.elo) / 1500)
+    # The result depends only on the server's stats and the two Elo ratings,
+    # none of which change mid-simulation, so repeated calls for the same
+    # matchup hit the cache instead of redoing ~30 scalar FP operations.
+    values = _expected_outcomes_cached(
+        server.elo, receiver.elo, tuple(sorted(server.stats.items()))
+    )
+    return dict(zip(EXPECTED_COLUMNS, values))
+
+@lru_cache(maxsize=512)
+def _expected_outcomes_cached(server_elo, receiver_elo, stats_items):
+    stats = dict(stats_items)
+    elo_factor = 1 + 0.05 * ((server_elo - receiver_elo) / 1500)
     p_in = stats['first_serve_in_pct'] / 100.0
 
     # Effective ace chance on first serve.
-    ace_first = max(0, stats['ace_rate_1st'] * elo_factor - stats.get('ace_rate_against', 0)) / 100.0
+    ace_first = max(0, stats['ace_rate_1st'] * elo_factor - stats['ace_rate_against']) / 100.0
     expected_aces_first = p_in * ace_first
 
     # Effective ace chance on second serve.
-    ace_second = max(0, stats['ace_rate_2nd'] * elo_factor - stats.get('ace_rate_against', 0)) / 100.0
+    ace_second = max(0, stats['ace_rate_2nd'] * elo_factor - stats['ace_rate_against']) / 100.0
     expected_aces_second = (1 - p_in) * (1 - stats['double_fault_pct'] / 100.0) * ace_second
 
     expected_aces = expected_aces_first + expected_aces_second
@@ -38,11 +78,124 @@ def compute_expected_outcomes(server, receiver):
     prob_rally = 1 - (expected_aces + expected_snv_wins + expected_double_faults + expected_snv_losses)
     expected_rally_win = prob_rally * effective_rally_win * 100
 
-    return {
-        'Aces': expected_aces * 100,
-        'Double Faults': expected_double_faults * 100,
-        'Serve & Volley Wins': expected_snv_wins * 100,
-        'Serve & Volley Losses': expected_snv_losses * 100,
-        'Points Won on Serve': expected_points_on_serve,
-        'Rally Wins as Server': expected_rally_win,
-    }
+    # Tuple in EXPECTED_COLUMNS order; the public wrapper rebuilds the dict
+    # per call so cached results are never shared mutable state.
+    return (
+        expected_aces * 100,
+        expected_double_faults * 100,
+        expected_snv_wins * 100,
+        expected_snv_losses * 100,
+        expected_points_on_serve,
+        expected_rally_win,
+    )
+
+def compute_expected_outcomes_batch(stats, elos, servers, receivers):
+    """
+    Vectorized compute_expected_outcomes for many matchups at once.
+
+    :param stats: (n_players, N_STATS) float array in fast.py column order.
+    :param elos: (n_players,) array of Elo ratings.
+    :param servers: index array of serving players, one per matchup.
+    :param receivers: index array of receiving players, one per matchup.
+    :return: (n_matchups, 6) array, columns per EXPECTED_COLUMNS.
+
+    Every formula below is the scalar function's line broadcast across the
+    gathered server rows, so one call covers a whole tournament slate.
+    """
+    s = stats[servers]
+    elo_factor = 1 + 0.05 * ((elos[servers] - elos[receivers]) / 1500)
+    p_in = s[:, FIRST_SERVE_IN] / 100.0
+
+    ace_first = np.maximum(0, s[:, ACE_1ST] * elo_factor - s[:, ACE_AGAINST]) / 100.0
+    expected_aces_first = p_in * ace_first
+
+    ace_second = np.maximum(0, s[:, ACE_2ND] * elo_factor - s[:, ACE_AGAINST]) / 100.0
+    double_fault = s[:, DOUBLE_FAULT] / 100.0
+    expected_aces_second = (1 - p_in) * (1 - double_fault) * ace_second
+
+    expected_aces = expected_aces_first + expected_aces_second
+    expected_double_faults = (1 - p_in) * double_fault
+
+    effective_snv_freq = s[:, SNV_FREQ] * elo_factor / 100.0
+    effective_snv_win = s[:, SNV_WIN] * elo_factor / 100.0
+    expected_snv_wins = p_in * effective_snv_freq * effective_snv_win
+    expected_snv_losses = p_in * effective_snv_freq * (1 - effective_snv_win)
+
+    expected_points_on_serve = (expected_aces + expected_snv_wins) * 100  # in %
+
+    weighted_rally = (
+        0.30 * s[:, RALLY_1_3] +
+        0.40 * s[:, RALLY_4_6] +
+        0.20 * s[:, RALLY_7_9] +
+        0.10 * s[:, RALLY_10PLUS]
+    )
+    effective_rally_win = ((weighted_rally + (100 - s[:, RETURN_RIPW])) / 2.0) * elo_factor / 100.0
+    prob_rally = 1 - (expected_aces + expected_snv_wins + expected_double_faults + expected_snv_losses)
+    expected_rally_win = prob_rally * effective_rally_win * 100
+
+    return np.column_stack([
+        expected_aces * 100,
+        expected_double_faults * 100,
+        expected_snv_wins * 100,
+        expected_snv_losses * 100,
+        expected_points_on_serve,
+        expected_rally_win,
+    ])
+
+def compute_expected_outcomes_matrix(stats_a, elo_a, stats_b=None, elo_b=None):
+    """
+    All-pairs expected outcomes: every player in group A serving against
+    every player in group B (B defaults to A, the round-robin case).
+
+    :param stats_a: (M, N_STATS) float array of serving players' stats.
+    :param elo_a: (M,) array of serving players' Elo ratings.
+    :param stats_b: (K, N_STATS) array of receivers' stats; defaults to stats_a.
+    :param elo_b: (K,) array of receivers' Elo ratings; defaults to elo_a.
+    :return: (M, K, 6) array, trailing axis per EXPECTED_COLUMNS.
+
+    One broadcast over (M, 1) server columns and (K,) receiver rows replaces
+    M*K scalar calls; the server-only terms carry a trailing unit axis so
+    they expand against the receiver-dependent elo_factor grid.
+    """
+    if stats_b is None:
+        stats_b = stats_a
+    if elo_b is None:
+        elo_b = elo_a
+    elo_factor = 1 + 0.05 * ((np.asarray(elo_a)[:, None] - np.asarray(elo_b)[None, :]) / 1500)
+    p_in = stats_a[:, FIRST_SERVE_IN, None] / 100.0
+
+    ace_first = np.maximum(0, stats_a[:, ACE_1ST, None] * elo_factor - stats_a[:, ACE_AGAINST, None]) / 100.0
+    expected_aces_first = p_in * ace_first
+
+    ace_second = np.maximum(0, stats_a[:, ACE_2ND, None] * elo_factor - stats_a[:, ACE_AGAINST, None]) / 100.0
+    double_fault = stats_a[:, DOUBLE_FAULT, None] / 100.0
+    expected_aces_second = (1 - p_in) * (1 - double_fault) * ace_second
+
+    expected_aces = expected_aces_first + expected_aces_second
+    expected_double_faults = (1 - p_in) * double_fault
+
+    effective_snv_freq = stats_a[:, SNV_FREQ, None] * elo_factor / 100.0
+    effective_snv_win = stats_a[:, SNV_WIN, None] * elo_factor / 100.0
+    expected_snv_wins = p_in * effective_snv_freq * effective_snv_win
+    expected_snv_losses = p_in * effective_snv_freq * (1 - effective_snv_win)
+
+    expected_points_on_serve = (expected_aces + expected_snv_wins) * 100  # in %
+
+    weighted_rally = (
+        0.30 * stats_a[:, RALLY_1_3, None] +
+        0.40 * stats_a[:, RALLY_4_6, None] +
+        0.20 * stats_a[:, RALLY_7_9, None] +
+        0.10 * stats_a[:, RALLY_10PLUS, None]
+    )
+    effective_rally_win = ((weighted_rally + (100 - stats_a[:, RETURN_RIPW, None])) / 2.0) * elo_factor / 100.0
+    prob_rally = 1 - (expected_aces + expected_snv_wins + expected_double_faults + expected_snv_losses)
+    expected_rally_win = prob_rally * effective_rally_win * 100
+
+    return np.stack([
+        expected_aces * 100,
+        expected_double_faults * 100,
+        expected_snv_wins * 100,
+        expected_snv_losses * 100,
+        expected_points_on_serve,
+        expected_rally_win,
+    ], axis=-1)
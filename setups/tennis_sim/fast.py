@@ -0,0 +1,261 @@
+"""
+fast.py: JIT-compiled point simulation kernels.
+The class-based simulators (ServeSimulator/RallySimulator/PointSimulator)
+stay as the readable reference path; these free functions operate on flat
+NumPy stat arrays so Numba can compile the whole point loop to machine code.
+Numba is optional — without it the kernels still run as plain Python.
+"""
+
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba not installed
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+LEAGUE_AVG_ELO = 1500
+ELO_ADJUSTMENT_FACTOR = 0.05
+
+# Stat-column and event-count offsets live with TennisPlayer (player.py is
+# the single source of truth for the array layouts); re-exported here for
+# callers working purely with the array kernels.
+from .player import (
+    _STAT_KEYS,
+    DEFAULT_STATS,
+    FIRST_SERVE_IN,
+    ACE_1ST,
+    ACE_2ND,
+    DOUBLE_FAULT,
+    SNV_FREQ,
+    SNV_WIN,
+    RALLY_1_3,
+    RALLY_4_6,
+    RALLY_7_9,
+    RALLY_10PLUS,
+    ACE_AGAINST,
+    RETURN_RIPW,
+    N_STATS,
+    ACES,
+    DOUBLE_FAULTS,
+    SNV_WINS,
+    SNV_LOSSES,
+    POINTS_ON_SERVE,
+    RALLY_WINS_SERVER,
+    RALLY_WINS_RECEIVER,
+    N_COUNTS,
+)
+
+
+def stats_array(stats):
+    """Flatten a TennisPlayer-style stats dict into the fixed column order."""
+    merged = {**DEFAULT_STATS, **stats}
+    return np.array([merged[k] for k in _STAT_KEYS], dtype=np.float64)
+
+
+def elo_factor(server_elo, receiver_elo):
+    return 1 + ELO_ADJUSTMENT_FACTOR * ((server_elo - receiver_elo) / LEAGUE_AVG_ELO)
+
+
+def players_table(players, dtype=np.float32):
+    """
+    Pack a roster of TennisPlayers into dense columnar arrays for
+    tournament-scale work: a names tuple, an (N,) float64 Elo array, and a
+    C-contiguous (N, N_STATS) stats matrix. float32 is the default stat
+    dtype — the per-point thresholds don't need double precision, and
+    halving the row size halves the memory traffic when N grows. Row
+    indices feed straight into the batch/matrix helpers in expected.py.
+    """
+    names = tuple(p.name for p in players)
+    elos = np.array([p.elo for p in players], dtype=np.float64)
+    stats = np.array([p.s for p in players], dtype=dtype)
+    return names, elos, stats
+
+
+@njit(cache=True)
+def simulate_point_fast(server_stats, receiver_stats, elo_f, server_counts, receiver_counts):
+    """
+    Simulate one point. Returns 1 if the server wins it, else 0.
+    Mirrors ServeSimulator/RallySimulator/PointSimulator on flat arrays.
+    """
+    # --- First serve ---
+    if np.random.random() * 100 < server_stats[FIRST_SERVE_IN]:
+        effective_ace = (server_stats[ACE_1ST] * elo_f
+                         - 0.5 * receiver_stats[ACE_AGAINST])
+        if effective_ace < 0.5:
+            effective_ace = 0.5
+        if np.random.random() * 100 < effective_ace:
+            server_counts[ACES] += 1
+            server_counts[POINTS_ON_SERVE] += 1
+            return 1
+        if np.random.random() * 100 < server_stats[SNV_FREQ] * elo_f:
+            if np.random.random() * 100 < server_stats[SNV_WIN] * elo_f:
+                server_counts[SNV_WINS] += 1
+                server_counts[POINTS_ON_SERVE] += 1
+                return 1
+            server_counts[SNV_LOSSES] += 1
+            return 0
+    else:
+        # --- Second serve ---
+        if np.random.random() * 100 < server_stats[DOUBLE_FAULT]:
+            server_counts[DOUBLE_FAULTS] += 1
+            return 0
+        effective_ace = (server_stats[ACE_2ND] * elo_f
+                         - 0.5 * receiver_stats[ACE_AGAINST])
+        if effective_ace < 0.5:
+            effective_ace = 0.5
+        if np.random.random() * 100 < effective_ace:
+            server_counts[ACES] += 1
+            server_counts[POINTS_ON_SERVE] += 1
+            return 1
+
+    # --- Rally ---
+    r = np.random.random()
+    if r < 0.30:
+        base_rally_win = server_stats[RALLY_1_3]
+    elif r < 0.70:
+        base_rally_win = server_stats[RALLY_4_6]
+    elif r < 0.90:
+        base_rally_win = server_stats[RALLY_7_9]
+    else:
+        base_rally_win = server_stats[RALLY_10PLUS]
+    receiver_defense = 100 - receiver_stats[RETURN_RIPW]
+    effective_rally_win = ((base_rally_win + receiver_defense) / 2) * elo_f / 100.0
+    if np.random.random() < effective_rally_win:
+        server_counts[RALLY_WINS_SERVER] += 1
+        return 1
+    receiver_counts[RALLY_WINS_RECEIVER] += 1
+    return 0
+
+
+def simulate_batch(server_stats, receiver_stats, elo_f, n_points,
+                   server_counts, receiver_counts, rng=None):
+    """
+    Simulate n_points serves by one server as vectorized NumPy ops: all
+    random draws happen in bulk up front and outcomes resolve as boolean
+    masks, so no Python-level per-point loop runs at all. Event tallies
+    accumulate into the counts arrays; returns the server's points won.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    s = server_stats
+    r = receiver_stats
+
+    first_in = rng.random(n_points) * 100 < s[FIRST_SERVE_IN]
+
+    eff_ace1 = max(0.5, s[ACE_1ST] * elo_f - 0.5 * r[ACE_AGAINST])
+    ace1 = first_in & (rng.random(n_points) * 100 < eff_ace1)
+
+    snv_try = first_in & ~ace1 & (rng.random(n_points) * 100 < s[SNV_FREQ] * elo_f)
+    snv_win = snv_try & (rng.random(n_points) * 100 < s[SNV_WIN] * elo_f)
+    snv_loss = snv_try & ~snv_win
+
+    second = ~first_in
+    double_fault = second & (rng.random(n_points) * 100 < s[DOUBLE_FAULT])
+    eff_ace2 = max(0.5, s[ACE_2ND] * elo_f - 0.5 * r[ACE_AGAINST])
+    ace2 = second & ~double_fault & (rng.random(n_points) * 100 < eff_ace2)
+
+    aces = ace1 | ace2
+    rally = ~(aces | snv_win | snv_loss | double_fault)
+    r_bracket = rng.random(n_points)
+    bracket = (r_bracket >= 0.30).astype(np.int64) + (r_bracket >= 0.70) + (r_bracket >= 0.90)
+    rally_base = np.array([s[RALLY_1_3], s[RALLY_4_6], s[RALLY_7_9], s[RALLY_10PLUS]])[bracket]
+    eff_rally = ((rally_base + (100 - r[RETURN_RIPW])) / 2) * elo_f / 100.0
+    rally_win = rally & (rng.random(n_points) < eff_rally)
+    rally_loss = rally & ~rally_win
+
+    n_aces = np.count_nonzero(aces)
+    n_snv_wins = np.count_nonzero(snv_win)
+    n_rally_wins = np.count_nonzero(rally_win)
+    server_counts[ACES] += n_aces
+    server_counts[DOUBLE_FAULTS] += np.count_nonzero(double_fault)
+    server_counts[SNV_WINS] += n_snv_wins
+    server_counts[SNV_LOSSES] += np.count_nonzero(snv_loss)
+    server_counts[POINTS_ON_SERVE] += n_aces + n_snv_wins
+    server_counts[RALLY_WINS_SERVER] += n_rally_wins
+    receiver_counts[RALLY_WINS_RECEIVER] += np.count_nonzero(rally_loss)
+    return n_aces + n_snv_wins + n_rally_wins
+
+
+def simulate_batch_players(server, receiver, n_points, rng=None):
+    """
+    TennisPlayer-level wrapper over simulate_batch: flattens both players'
+    stats and accumulates event tallies straight into their point_stats
+    arrays. Returns the server's points won.
+    """
+    return simulate_batch(
+        stats_array(server.stats), stats_array(receiver.stats),
+        elo_factor(server.elo, receiver.elo), n_points,
+        server.point_stats, receiver.point_stats, rng,
+    )
+
+
+def _batch_worker(args):
+    """Pool worker: run one chunk on its own jumped Philox stream."""
+    server_stats, receiver_stats, elo_f, n_points, seed, worker_id = args
+    rng = np.random.Generator(np.random.Philox(seed).jumped(worker_id))
+    server_counts = np.zeros(N_COUNTS, dtype=np.int64)
+    receiver_counts = np.zeros(N_COUNTS, dtype=np.int64)
+    won = simulate_batch(server_stats, receiver_stats, elo_f, n_points,
+                         server_counts, receiver_counts, rng)
+    return won, server_counts, receiver_counts
+
+
+def simulate_batch_parallel(server_stats, receiver_stats, elo_f, n_points,
+                            server_counts, receiver_counts, workers=None, seed=None):
+    """
+    Split a batch of serves across a multiprocessing Pool. Worker i draws
+    from the shared Philox seed jumped i times — each jump skips 2**128
+    draws, so chunks never share randomness and a fixed seed reproduces
+    the whole run. Each worker simulates its chunk with simulate_batch and
+    returns its tallies; the parent merges the per-worker count arrays by
+    summation. Returns the server's points won, with event counts
+    accumulated into the passed arrays as usual.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    base, extra = divmod(n_points, workers)
+    sizes = [base + (1 if i < extra else 0) for i in range(workers)]
+    jobs = [(server_stats, receiver_stats, elo_f, size, seed, i)
+            for i, size in enumerate(sizes) if size]
+    with Pool(len(jobs)) as pool:
+        results = pool.map(_batch_worker, jobs)
+    won = 0
+    for chunk_won, chunk_server, chunk_receiver in results:
+        won += chunk_won
+        server_counts += chunk_server
+        receiver_counts += chunk_receiver
+    return won
+
+
+@njit(cache=True)
+def simulate_n_points(n, stats_a, stats_b, elo_f_ab, elo_f_ba, counts_a, counts_b):
+    """
+    Simulate n points with alternating serve (player A serves the even points).
+    Returns (points_won_a, points_won_b); event tallies accumulate into the
+    counts arrays in place.
+    """
+    points_a = 0
+    points_b = 0
+    for i in range(n):
+        if i % 2 == 0:
+            if simulate_point_fast(stats_a, stats_b, elo_f_ab, counts_a, counts_b) == 1:
+                points_a += 1
+            else:
+                points_b += 1
+        else:
+            if simulate_point_fast(stats_b, stats_a, elo_f_ba, counts_b, counts_a) == 1:
+                points_b += 1
+            else:
+                points_a += 1
+    return points_a, points_b
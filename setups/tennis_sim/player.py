@@ -2,6 +2,81 @@
 player.py: Contains the TennisPlayer class.
 """
 
+import numpy as np
+
+# Column order of a player's stats array (percent-denominated, as in the
+# TennisPlayer.stats dict). The simulators index these columns instead of
+# hashing dict keys on every point.
+FIRST_SERVE_IN = 0
+ACE_1ST = 1
+ACE_2ND = 2
+DOUBLE_FAULT = 3
+SNV_FREQ = 4
+SNV_WIN = 5
+RALLY_1_3 = 6
+RALLY_4_6 = 7
+RALLY_7_9 = 8
+RALLY_10PLUS = 9
+ACE_AGAINST = 10
+RETURN_RIPW = 11
+N_STATS = 12
+
+# Merged under every incoming stats dict at construction so downstream code
+# can index keys and columns unconditionally — no .get(key, default) in the
+# hot paths, and the array build needs no missing-key guards. return_RiPW
+# defaults to the neutral 50% the rally math assumed for absent receivers.
+DEFAULT_STATS = {
+    'first_serve_in_pct': 0.0,
+    'ace_rate_1st': 0.0,
+    'ace_rate_2nd': 0.0,
+    'double_fault_pct': 0.0,
+    'serve_and_volley_freq': 0.0,
+    'serve_and_volley_win_pct': 0.0,
+    'rally_1_3_win': 0.0,
+    'rally_4_6_win': 0.0,
+    'rally_7_9_win': 0.0,
+    'rally_10plus_win': 0.0,
+    'ace_rate_against': 0.0,
+    'return_RiPW': 50.0,
+}
+
+_STAT_KEYS = (
+    'first_serve_in_pct',
+    'ace_rate_1st',
+    'ace_rate_2nd',
+    'double_fault_pct',
+    'serve_and_volley_freq',
+    'serve_and_volley_win_pct',
+    'rally_1_3_win',
+    'rally_4_6_win',
+    'rally_7_9_win',
+    'rally_10plus_win',
+    'ace_rate_against',
+    'return_RiPW',
+)
+
+# Offsets into TennisPlayer.point_stats. A flat int64 array makes each
+# increment an indexed store instead of a dict hash + boxed-int update, and
+# lets the counters pass straight into the jitted kernels in fast.py.
+ACES = 0
+DOUBLE_FAULTS = 1
+SNV_WINS = 2
+SNV_LOSSES = 3
+POINTS_ON_SERVE = 4
+RALLY_WINS_SERVER = 5
+RALLY_WINS_RECEIVER = 6
+N_COUNTS = 7
+
+_COUNT_KEYS = (
+    'Aces',
+    'Double Faults',
+    'Serve & Volley Wins',
+    'Serve & Volley Losses',
+    'Points Won on Serve',
+    'Rally Wins as Server',
+    'Rally Wins as Receiver',
+)
+
 class TennisPlayer:
     def __init__(self, name, elo, stats):
         """
@@ -11,14 +86,18 @@ class TennisPlayer:
         """
         self.name = name
         self.elo = elo
-        self.stats = stats
-        # Tracking events during simulation.
-        self.point_stats = {
-            'Aces': 0,
-            'Double Faults': 0,
-            'Serve & Volley Wins': 0,
-            'Serve & Volley Losses': 0,
-            'Points Won on Serve': 0,         # Immediate wins (ace or S&V win)
-            'Rally Wins as Server': 0,         # Rally wins when serving
-            'Rally Wins as Receiver': 0,       # Rally wins when receiving
-        }
+        self.stats = {**DEFAULT_STATS, **stats}
+        # Structure-of-arrays view of the stats: one contiguous float64 row
+        # in _STAT_KEYS column order (percent-denominated, like the dict)...
+        self.s = np.array([self.stats[k] for k in _STAT_KEYS], dtype=np.float64)
+        # ...and the fraction-denominated copy the per-point simulators index
+        # by the column constants above, so a uniform draw compares against
+        # p[col] directly with no key hashing or *100 scaling.
+        self.p = self.s / 100.0
+        # Tracking events during simulation, indexed by the offset constants
+        # above (ACES, DOUBLE_FAULTS, ..., RALLY_WINS_RECEIVER).
+        self.point_stats = np.zeros(N_COUNTS, dtype=np.int64)
+
+    def point_stats_dict(self):
+        """Named view of the counters, built lazily for summary/print code."""
+        return dict(zip(_COUNT_KEYS, self.point_stats.tolist()))
@@ -3,24 +3,43 @@ point.py: Contains the PointSimulator class.
 This module integrates serve and rally phases to simulate a complete point.
 """
 
-from .serve import ServeSimulator
+from .player import POINTS_ON_SERVE, RALLY_WINS_RECEIVER, RALLY_WINS_SERVER
+from .serve import (
+    ELO_ADJUSTMENT_FACTOR,
+    LEAGUE_AVG_ELO,
+    OUT_ACE,
+    OUT_ACE_2ND,
+    OUT_DOUBLE_FAULT,
+    OUT_SNV_LOSS,
+    OUT_SNV_WIN,
+    ServeSimulator,
+)
 from .rally import RallySimulator
 
+# Outcome codes that end the point on serve, grouped by who takes it.
+_SERVER_WINS = (OUT_ACE, OUT_ACE_2ND, OUT_SNV_WIN)
+_RECEIVER_WINS = (OUT_DOUBLE_FAULT, OUT_SNV_LOSS)
+
 class PointSimulator:
     @staticmethod
-    def simulate_point(server, receiver):
-        outcome = ServeSimulator.simulate_first_serve(server, receiver)
+    def simulate_point(server, receiver, elo_factor=None):
+        # The Elo factor is fixed for a matchup; compute it once here (or
+        # accept it from callers looping many points) and thread it through
+        # the serve and rally phases instead of re-deriving it in each.
+        if elo_factor is None:
+            elo_factor = 1 + ELO_ADJUSTMENT_FACTOR * ((server.elo - receiver.elo) / LEAGUE_AVG_ELO)
+        outcome = ServeSimulator.simulate_first_serve(server, receiver, elo_factor)
         if outcome is None:
-            outcome = ServeSimulator.simulate_second_serve(server, receiver)
-        if outcome in ['ace', 'ace_2nd', 'serve_and_volley_win']:
-            server.point_stats['Points Won on Serve'] += 1
+            outcome = ServeSimulator.simulate_second_serve(server, receiver, elo_factor)
+        if outcome in _SERVER_WINS:
+            server.point_stats[POINTS_ON_SERVE] += 1
             return server.name
-        elif outcome in ['double_fault', 'serve_and_volley_loss']:
+        elif outcome in _RECEIVER_WINS:
             return receiver.name
         else:
-            rally_winner, _ = RallySimulator.simulate_rally(server, receiver)
+            rally_winner, _ = RallySimulator.simulate_rally(server, receiver, elo_factor)
             if rally_winner == server.name:
-                server.point_stats['Rally Wins as Server'] += 1
+                server.point_stats[RALLY_WINS_SERVER] += 1
             else:
-                receiver.point_stats['Rally Wins as Receiver'] += 1
+                receiver.point_stats[RALLY_WINS_RECEIVER] += 1
             return rally_winner
@@ -0,0 +1,48 @@
+"""
+rng.py: Shared buffered uniform source for the scalar simulators.
+Drawing uniforms one at a time through the random module pays a Python-level
+call per draw; refilling a NumPy buffer in bulk amortizes that cost to one
+vectorized draw per _BUF_SIZE scalars. The generator is counter-based
+(Philox), so parallel workers can take non-overlapping jumped streams from
+the same seed instead of gambling on independent seeding.
+"""
+
+import numpy as np
+
+_BUF_SIZE = 8192
+_rng = np.random.Generator(np.random.Philox())
+_buf = _rng.random(_BUF_SIZE)
+_idx = 0
+
+
+def _u():
+    """Return the next uniform [0, 1) draw from the shared buffer."""
+    global _idx, _buf
+    i = _idx
+    if i == _BUF_SIZE:
+        _buf = _rng.random(_BUF_SIZE)
+        i = 0
+    _idx = i + 1
+    return _buf[i]
+
+
+def batch_uniform(n):
+    """Draw n uniforms in one vectorized call from the shared generator."""
+    return _rng.random(n)
+
+
+def seed(value=None):
+    """Re-seed the shared generator and discard any buffered draws."""
+    global _rng, _buf, _idx
+    _rng = np.random.Generator(np.random.Philox(value))
+    _buf = _rng.random(_BUF_SIZE)
+    _idx = 0
+
+
+def jumped(worker_id, value=None):
+    """
+    Build an independent generator for parallel worker worker_id: each jump
+    advances the Philox counter by 2**128 draws, so streams from the same
+    seed never overlap.
+    """
+    return np.random.Generator(np.random.Philox(value).jumped(worker_id))
@@ -1,12 +1,22 @@
 """
 run_sim.py: A sample script to run the point simulation.
-This script simulates 5,000 points with alternating serves between two players
-(using real-life stats for Iga Swiatek and Aryna Sabalenka) and prints a detailed summary.
+This script simulates up to 5,000 points with alternating serves between two
+players (using real-life stats for Iga Swiatek and Aryna Sabalenka) and prints
+a detailed summary. Points run as vectorized 500-point batches per server that
+draw all random numbers up front, stopping early once every tracked per-serve
+rate is resolved to within a 0.1% standard error.
 """
 
+import numpy as np
+
 from tennis_sim.player import TennisPlayer
-from tennis_sim.point import PointSimulator
-from tennis_sim.expected import compute_expected_outcomes
+from tennis_sim.expected import EXPECTED_COLUMNS, compute_expected_outcomes
+from tennis_sim.fast import (
+    N_COUNTS,
+    elo_factor,
+    simulate_batch,
+    stats_array,
+)
 
 def main():
     # Real-life stats for Iga Swiatek (subset)
@@ -46,70 +56,75 @@ def main():
     aryna = TennisPlayer("Aryna Sabalenka", elo=2000, stats=sabalenka_stats)
 
     total_points = 5000
-    serves_per_player = total_points / 2  # 2,500 serves per player
-
-    total_points_iga = 0
-    total_points_aryna = 0
-
-    # Simulate 5,000 points with alternating serve.
-    for i in range(total_points):
-        if i % 2 == 0:
-            winner = PointSimulator.simulate_point(iga, aryna)
-            if winner == iga.name:
-                total_points_iga += 1
-            else:
-                total_points_aryna += 1
-        else:
-            winner = PointSimulator.simulate_point(aryna, iga)
-            if winner == aryna.name:
-                total_points_aryna += 1
-            else:
-                total_points_iga += 1
-
-    # Compute simulated per-serve percentages.
-    def simulated_rate(player):
-        return {
-            'Aces': (player.point_stats['Aces'] / serves_per_player) * 100,
-            'Double Faults': (player.point_stats['Double Faults'] / serves_per_player) * 100,
-            'Serve & Volley Wins': (player.point_stats['Serve & Volley Wins'] / serves_per_player) * 100,
-            'Serve & Volley Losses': (player.point_stats['Serve & Volley Losses'] / serves_per_player) * 100,
-            'Points Won on Serve': (player.point_stats['Points Won on Serve'] / serves_per_player) * 100,
-            'Rally Wins as Server': (player.point_stats['Rally Wins as Server'] / serves_per_player) * 100,
-        }
-    
-    sim_rates_iga = simulated_rate(iga)
-    sim_rates_aryna = simulated_rate(aryna)
+    max_serves = total_points // 2  # budget: up to 2,500 serves per player
+    chunk_size = 500
+    stderr_target = 0.001  # stop once every tracked rate is known to ±0.1%
+
+    # Flat stat arrays + per-player event counters for the batch kernels.
+    iga_arr = stats_array(iga_stats)
+    aryna_arr = stats_array(sabalenka_stats)
+    iga_counts = np.zeros(N_COUNTS, dtype=np.int64)
+    aryna_counts = np.zeros(N_COUNTS, dtype=np.int64)
+    rng = np.random.default_rng()
+    elo_iga = elo_factor(iga.elo, aryna.elo)
+    elo_aryna = elo_factor(aryna.elo, iga.elo)
+
+    # Simulate service points in vectorized chunks, stopping early once the
+    # standard error of every tracked per-serve rate drops below the target.
+    # The events are Bernoulli per serve, so sqrt(p*(1-p)/n) is exactly the
+    # Welford-style running standard error of the mean.
+    iga_won_serving = 0
+    aryna_won_serving = 0
+    serves_per_player = 0
+    while serves_per_player < max_serves:
+        n = min(chunk_size, max_serves - serves_per_player)
+        iga_won_serving += simulate_batch(iga_arr, aryna_arr, elo_iga,
+                                          n, iga_counts, aryna_counts, rng)
+        aryna_won_serving += simulate_batch(aryna_arr, iga_arr, elo_aryna,
+                                            n, aryna_counts, iga_counts, rng)
+        serves_per_player += n
+        # Columns 0-5 are the per-serve events (receiver rally wins excluded).
+        rates = np.concatenate([iga_counts[:6], aryna_counts[:6]]) / serves_per_player
+        stderr = np.sqrt(rates * (1 - rates) / serves_per_player)
+        if stderr.max() < stderr_target:
+            break
+
+    total_points_iga = iga_won_serving + (serves_per_player - aryna_won_serving)
+    total_points_aryna = aryna_won_serving + (serves_per_player - iga_won_serving)
+
+    # Simulated per-serve percentages: columns 0-5 of the count arrays are
+    # the tracked per-serve events, so one broadcast division covers all six.
+    sim_rates_iga = iga_counts[:6] * (100.0 / serves_per_player)
+    sim_rates_aryna = aryna_counts[:6] * (100.0 / serves_per_player)
 
     expected_iga = compute_expected_outcomes(iga, aryna)
     expected_aryna = compute_expected_outcomes(aryna, iga)
 
-    def print_summary(player_name, expected, simulated):
+    def print_summary(player_name, expected, rates):
         print(f"{player_name}:")
         print(f"{'Event':<25}{'Base Rate (%)':>15}{'Simulated (%)':>20}{'Difference (%)':>20}")
         print("-" * 80)
-        for event in expected.keys():
+        # The count columns share the expected dict's ordering, so the rates
+        # array lines up with EXPECTED_COLUMNS by position.
+        for i, event in enumerate(EXPECTED_COLUMNS):
             base_rate = expected[event]
-            sim_rate = simulated.get(event, 0)
+            sim_rate = rates[i]
             diff = sim_rate - base_rate
             print(f"{event:<25}{base_rate:15.2f}{sim_rate:20.2f}{diff:20.2f}")
-        print("
-")
-    
-    print("
---- Summary of 5,000 Points (Per-Serve Rates) ---
-")
+        print("\n")
+
+    print(f"\n--- Summary of {2 * serves_per_player:,} Points (Per-Serve Rates) ---\n")
     print_summary(f"Iga Swiatek (Serving vs Aryna Sabalenka, Elo: {iga.elo})", expected_iga, sim_rates_iga)
     print_summary(f"Aryna Sabalenka (Serving vs Iga Swiatek, Elo: {aryna.elo})", expected_aryna, sim_rates_aryna)
-    
+
     print("Overall Points Won:")
     print(f"  Iga Swiatek: {total_points_iga} points")
-    print(f"  Aryna Sabalenka: {total_points_aryna} points
-")
-    
+    print(f"  Aryna Sabalenka: {total_points_aryna} points\n")
+
     print("Detailed Point Stats (Absolute counts):")
-    print(f"Iga Swiatek: {iga.point_stats}")
-    print(f"Aryna Sabalenka: {aryna.point_stats}")
-    
+    print(f"Iga Swiatek: {iga_counts}")
+    print(f"Aryna Sabalenka: {aryna_counts}")
+
     print("\nNote: Base rates are computed from the input stats (adjusted by Elo and opposing stats),")
     print("and the rally calculations now use a weighted distribution of rally lengths.")
 
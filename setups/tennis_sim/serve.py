@@ -1,59 +1,134 @@
 """
 serve.py: Contains the ServeSimulator class.
-This module simulates first and second serves with Elo adjustments
-and introduces variance into the ace chance calculation.
+This module simulates first and second serves with Elo adjustments.
 """
 
-import random
-
-from .player import TennisPlayer
+from .rng import _u
+from .player import (
+    ACE_1ST,
+    ACE_2ND,
+    ACE_AGAINST,
+    ACES,
+    DOUBLE_FAULT,
+    DOUBLE_FAULTS,
+    FIRST_SERVE_IN,
+    SNV_FREQ,
+    SNV_LOSSES,
+    SNV_WIN,
+    SNV_WINS,
+    TennisPlayer,
+)
 LEAGUE_AVG_ELO = 1500
 ELO_ADJUSTMENT_FACTOR = 0.05
 
+# Serve outcome codes. Integer returns let PointSimulator dispatch on small
+# constants instead of comparing freshly built strings every point; a first-
+# serve fault still returns None so the two-serve flow reads unchanged.
+OUT_ACE = 0
+OUT_SNV_WIN = 1
+OUT_SNV_LOSS = 2
+OUT_IN_PLAY = 3
+OUT_DOUBLE_FAULT = 4
+OUT_ACE_2ND = 5
+
 class ServeSimulator:
     @staticmethod
-    def simulate_first_serve(server: TennisPlayer, receiver: TennisPlayer):
-        if random.random() * 100 < server.stats['first_serve_in_pct']:
-            # First serve is in.
-            base_ace = server.stats['ace_rate_1st']
+    def simulate_first_serve(server: TennisPlayer, receiver: TennisPlayer, elo_factor=None):
+        # elo_factor is constant per matchup; callers looping points should
+        # precompute it once and pass it through.
+        if elo_factor is None:
             elo_factor = 1 + ELO_ADJUSTMENT_FACTOR * ((server.elo - receiver.elo) / LEAGUE_AVG_ELO)
-            # Introduce variance and subtract only a fraction of the receiver's defensive stat.
-            effective_ace_chance = base_ace * elo_factor - 0.5 * receiver.stats.get('ace_rate_against', 0)
-            variance = random.uniform(0.9, 1.1)
-            effective_ace_chance *= variance
+        # Bind the stat rows to locals once; every branch below indexes them
+        # by column constant, and LOAD_FAST + integer indexing beats repeated
+        # attribute + dict-key access. p holds the fraction-denominated
+        # stats, so draws compare directly against _u() with no *100 scaling.
+        p = server.p
+        point_stats = server.point_stats
+        if _u() < p[FIRST_SERVE_IN]:
+            # First serve is in.
+            base_ace = p[ACE_1ST]
+            # Subtract only a fraction of the receiver's defensive stat. The
+            # old uniform(0.9, 1.1) variance multiplier is gone: it averaged
+            # out to the plain threshold over any long run, so it bought one
+            # extra RNG draw per serve for pure noise.
+            effective_ace_chance = base_ace * elo_factor - 0.5 * receiver.p[ACE_AGAINST]
             # Floor at a minimum chance (e.g., 0.5%)
-            effective_ace_chance = max(0.5, effective_ace_chance)
-            if random.random() * 100 < effective_ace_chance:
-                server.point_stats['Aces'] += 1
-                return 'ace'
+            effective_ace_chance = max(0.005, effective_ace_chance)
+            if _u() < effective_ace_chance:
+                point_stats[ACES] += 1
+                return OUT_ACE
             # Check serve-and-volley option.
-            base_snv_freq = server.stats['serve_and_volley_freq']
-            effective_snv_freq = base_snv_freq * elo_factor
-            if random.random() * 100 < effective_snv_freq:
-                base_snv_win = server.stats['serve_and_volley_win_pct']
-                effective_snv_win = base_snv_win * elo_factor
-                if random.random() * 100 < effective_snv_win:
-                    server.point_stats['Serve & Volley Wins'] += 1
-                    return 'serve_and_volley_win'
+            effective_snv_freq = p[SNV_FREQ] * elo_factor
+            if _u() < effective_snv_freq:
+                effective_snv_win = p[SNV_WIN] * elo_factor
+                if _u() < effective_snv_win:
+                    point_stats[SNV_WINS] += 1
+                    return OUT_SNV_WIN
                 else:
-                    server.point_stats['Serve & Volley Losses'] += 1
-                    return 'serve_and_volley_loss'
-            return 'in_play'
+                    point_stats[SNV_LOSSES] += 1
+                    return OUT_SNV_LOSS
+            return OUT_IN_PLAY
         else:
             return None  # First serve fault.
 
     @staticmethod
-    def simulate_second_serve(server: TennisPlayer, receiver: TennisPlayer):
-        if random.random() * 100 < server.stats['double_fault_pct']:
-            server.point_stats['Double Faults'] += 1
-            return 'double_fault'
-        base_ace_2nd = server.stats['ace_rate_2nd']
+    def simulate_second_serve(server: TennisPlayer, receiver: TennisPlayer, elo_factor=None):
+        if elo_factor is None:
+            elo_factor = 1 + ELO_ADJUSTMENT_FACTOR * ((server.elo - receiver.elo) / LEAGUE_AVG_ELO)
+        p = server.p
+        if _u() < p[DOUBLE_FAULT]:
+            server.point_stats[DOUBLE_FAULTS] += 1
+            return OUT_DOUBLE_FAULT
+        base_ace_2nd = p[ACE_2ND]
+        effective_ace_chance_2nd = base_ace_2nd * elo_factor - 0.5 * receiver.p[ACE_AGAINST]
+        effective_ace_chance_2nd = max(0.005, effective_ace_chance_2nd)
+        if _u() < effective_ace_chance_2nd:
+            server.point_stats[ACES] += 1
+            return OUT_ACE_2ND
+        return OUT_IN_PLAY
+
+
+def make_serve_fn(server: TennisPlayer, receiver: TennisPlayer, elo_factor=None):
+    """
+    Specialize the two-serve flow for one (server, receiver) pairing.
+
+    Every threshold a serve can hit is fixed for the whole match, so this
+    factory resolves the Elo-adjusted values once and bakes them into
+    closure locals; the returned zero-argument callable replays the serve
+    logic with nothing but local reads and uniform draws, returning the
+    same outcome codes as the simulator methods and updating the server's
+    counters in place.
+    """
+    if elo_factor is None:
         elo_factor = 1 + ELO_ADJUSTMENT_FACTOR * ((server.elo - receiver.elo) / LEAGUE_AVG_ELO)
-        effective_ace_chance_2nd = base_ace_2nd * elo_factor - 0.5 * receiver.stats.get('ace_rate_against', 0)
-        variance = random.uniform(0.9, 1.1)
-        effective_ace_chance_2nd *= variance
-        effective_ace_chance_2nd = max(0.5, effective_ace_chance_2nd)
-        if random.random() * 100 < effective_ace_chance_2nd:
-            server.point_stats['Aces'] += 1
-            return 'ace_2nd'
-        return 'in_play'
+    p = server.p
+    point_stats = server.point_stats
+    p_in = p[FIRST_SERVE_IN]
+    ace_1st = max(0.005, p[ACE_1ST] * elo_factor - 0.5 * receiver.p[ACE_AGAINST])
+    snv_freq = p[SNV_FREQ] * elo_factor
+    snv_win = p[SNV_WIN] * elo_factor
+    df = p[DOUBLE_FAULT]
+    ace_2nd = max(0.005, p[ACE_2ND] * elo_factor - 0.5 * receiver.p[ACE_AGAINST])
+
+    def serve():
+        if _u() < p_in:
+            if _u() < ace_1st:
+                point_stats[ACES] += 1
+                return OUT_ACE
+            if _u() < snv_freq:
+                if _u() < snv_win:
+                    point_stats[SNV_WINS] += 1
+                    return OUT_SNV_WIN
+                point_stats[SNV_LOSSES] += 1
+                return OUT_SNV_LOSS
+            return OUT_IN_PLAY
+        # First-serve fault: straight into the second serve.
+        if _u() < df:
+            point_stats[DOUBLE_FAULTS] += 1
+            return OUT_DOUBLE_FAULT
+        if _u() < ace_2nd:
+            point_stats[ACES] += 1
+            return OUT_ACE_2ND
+        return OUT_IN_PLAY
+
+    return serve
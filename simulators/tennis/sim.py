@@ -4,141 +4,185 @@
 #              Daily stats are generated from base stats using random multipliers,
 #              and momentum is updated at break events and applied point-by-point.
 #              Finally, the match result is scored using DraftKings fantasy scoring.
+#
+#              The point/game/tiebreak/set kernels run on a flat float64 stat
+#              array indexed by constant columns, decorated with numba's @njit
+#              so the whole inner loop compiles to machine code when numba is
+#              installed (they still run as plain Python without it).
 
-import random
-import math
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+# Shared PCG64 generator for the Python-level (match setup) draws. The
+# jitted kernels keep calling np.random.random() directly: inside @njit
+# those lower to native per-thread generator calls with no Python boundary,
+# so an explicit uniform buffer threaded through them would only add
+# argument traffic.
+_RNG = np.random.default_rng()
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba not installed; kernels run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+    prange = range
+
+# Columns of the per-match daily stats array consumed by the kernels.
+ACE = 0
+DF = 1
+FSP = 2
+FSW = 3
+SSW = 4
+RPW = 5
+BPC = 6
+N_DAILY = 7
+
+# DraftKings best-of-3 scoring constants (points per event and bonuses).
+# Module-level so neither scorer rebuilds them per call; numba freezes them
+# into the jitted scorer at compile time.
+MATCH_PLAYED_PTS = 30.0
+GAME_WON_PTS = 2.5
+GAME_LOST_PTS = -2.0
+SET_WON_PTS = 6.0
+SET_LOST_PTS = -3.0
+MATCH_WON_PTS = 6.0
+ACE_PTS = 0.4
+DF_PTS = -1.0
+BREAK_PTS = 0.75
+CLEAN_SET_BONUS = 4.0
+STRAIGHT_SETS_BONUS = 6.0
+NO_DF_BONUS = 2.5
+MILESTONE_10_ACES = 2.0
+
+# Columns of the per-momentum threshold table: cumulative probabilities on a
+# single uniform draw (double fault below T_DF, ace in [T_DF, T_ACE), any
+# win below T_WIN).
+T_DF = 0
+T_ACE = 1
+T_WIN = 2
 
 # -------------------------------
 # Helper functions
 # -------------------------------
-def clip(value, min_value, max_value):
-    """Ensure that value is between min_value and max_value."""
-    return max(min_value, min(value, max_value))
-
 def generate_daily_stats(base_stats):
     """
     Generate today's stats for a player based on their base_stats,
     applying random variation (good day/bad day effects).
-    
+
     We use separate multipliers for serving and returning.
     For serving, a higher multiplier boosts AcePercentage, FirstServeWon% and SecondServeWon%,
     while reducing DoubleFaultPercentage.
+
+    Returns the 7-column daily array directly: only the stats the simulator
+    actually reads exist, with no dict copy of the unused base-stat keys.
     """
     # Draw multipliers from a normal distribution (mean 1.0, std dev 0.1), then clip.
-    serve_form = clip(random.gauss(1.0, 0.1), 0.7, 1.3)
-    return_form = clip(random.gauss(1.0, 0.1), 0.7, 1.3)
-    
-    daily = base_stats.copy()
-    # Adjust serve-related stats
-    daily['AcePercentage'] = clip(base_stats['AcePercentage'] * serve_form, 0, 1)
-    daily['FirstServeWonPercentage'] = clip(base_stats['FirstServeWonPercentage'] * serve_form, 0, 1)
-    daily['SecondServeWonPercentage'] = clip(base_stats['SecondServeWonPercentage'] * serve_form, 0, 1)
-    # For first serve percentage, we assume it stays roughly constant
-    daily['FirstServePercentage'] = base_stats['FirstServePercentage']
-    # Inverse relation for double faults: better serve form => fewer DFs.
-    daily['DoubleFaultPercentage'] = clip(base_stats['DoubleFaultPercentage'] / serve_form, 0, 1)
-    
-    # Adjust return-related stats
-    daily['ReturnPointsWonPercentage'] = clip(base_stats['ReturnPointsWonPercentage'] * return_form, 0, 1)
-    daily['BreakPointsConvertedPercentage'] = clip(base_stats['BreakPointsConvertedPercentage'] * return_form, 0, 1)
-    
-    # (Other stats remain as base stats for now)
-    return daily
+    # _RNG.standard_normal uses the Ziggurat method — no log calls per draw.
+    serve_form = min(max(1.0 + 0.1 * _RNG.standard_normal(), 0.7), 1.3)
+    return_form = min(max(1.0 + 0.1 * _RNG.standard_normal(), 0.7), 1.3)
+
+    return np.array([
+        min(base_stats['AcePercentage'] * serve_form, 1.0),
+        # Inverse relation for double faults: better serve form => fewer DFs.
+        min(base_stats['DoubleFaultPercentage'] / serve_form, 1.0),
+        # First serve percentage stays roughly constant day to day.
+        base_stats['FirstServePercentage'],
+        min(base_stats['FirstServeWonPercentage'] * serve_form, 1.0),
+        min(base_stats['SecondServeWonPercentage'] * serve_form, 1.0),
+        min(base_stats['ReturnPointsWonPercentage'] * return_form, 1.0),
+        min(base_stats['BreakPointsConvertedPercentage'] * return_form, 1.0),
+    ], dtype=np.float64)
 
-def apply_momentum_to_stats(daily_stats, momentum):
+def daily_stats_array(daily_stats):
+    """Pack a daily stats dict into the fixed kernel column order."""
+    return np.array([
+        daily_stats['AcePercentage'],
+        daily_stats['DoubleFaultPercentage'],
+        daily_stats['FirstServePercentage'],
+        daily_stats['FirstServeWonPercentage'],
+        daily_stats['SecondServeWonPercentage'],
+        daily_stats['ReturnPointsWonPercentage'],
+        daily_stats['BreakPointsConvertedPercentage'],
+    ], dtype=np.float64)
+
+# -------------------------------
+# Simulation functions
+# -------------------------------
+@njit(cache=True, fastmath=True)
+def momentum_table(daily):
     """
-    Adjust the player's daily stats based on current momentum.
-    
-    For a positive momentum, we slightly boost key percentages (e.g., Ace%,
-    FirstServeWon%, SecondServeWon%) and reduce DoubleFault%.
-    For a negative momentum, the reverse applies.
+    Cumulative point-outcome thresholds for every momentum value, built
+    once per match. Momentum is an integer in [-3, 3] and the daily stats
+    are fixed for the match, so each of the seven rows folds the adjusted
+    DF/ace/serve-win probabilities into three cumulative thresholds on one
+    uniform: P(df) = t1, P(ace) = (1-df)*ace, P(other win) =
+    (1-df)*(1-ace)*p_win — the same distribution the old two-draw,
+    multi-branch point produced.
     """
-    # Use a factor of 2% per momentum point.
-    factor = 1.0 + 0.02 * momentum
-
-    effective = daily_stats.copy()
-    effective['AcePercentage'] = clip(daily_stats['AcePercentage'] * factor, 0, 1)
-    effective['FirstServeWonPercentage'] = clip(daily_stats['FirstServeWonPercentage'] * factor, 0, 1)
-    effective['SecondServeWonPercentage'] = clip(daily_stats['SecondServeWonPercentage'] * factor, 0, 1)
-    # For double faults, if momentum is positive, we expect fewer DFs.
-    # We divide by the same factor (ensuring factor is never 0).
-    effective['DoubleFaultPercentage'] = clip(daily_stats['DoubleFaultPercentage'] / factor, 0, 1)
-    
-    # Other stats remain unchanged.
-    effective['FirstServePercentage'] = daily_stats['FirstServePercentage']
-    effective['ReturnPointsWonPercentage'] = daily_stats['ReturnPointsWonPercentage']
-    effective['BreakPointsConvertedPercentage'] = daily_stats['BreakPointsConvertedPercentage']
-    
-    return effective
-
-def update_momentum(player, event):
+    table = np.empty((7, 3))
+    for m in range(-3, 4):
+        factor = 1.0 + 0.02 * m
+        df = min(daily[DF] / factor, 1.0)
+        ace = min(daily[ACE] * factor, 1.0)
+        fsw = min(daily[FSW] * factor, 1.0)
+        ssw = min(daily[SSW] * factor, 1.0)
+        p_win = daily[FSP] * fsw + (1 - daily[FSP]) * ssw
+        t1 = df
+        t2 = t1 + (1 - df) * ace
+        t3 = t2 + (1 - df) * (1 - ace) * p_win
+        table[m + 3, T_DF] = t1
+        table[m + 3, T_ACE] = t2
+        table[m + 3, T_WIN] = t3
+    return table
+
+@njit(cache=True, fastmath=True)
+def _point_from_row(row):
     """
-    Update a player's momentum based on an event.
-    
-    For a break (winning on serve when not serving), add +1.
-    For losing a break, subtract 1.
-    We cap momentum between -3 and +3.
+    One point against a prefetched threshold row: a single uniform draw
+    compared against the cumulative thresholds, with no data-dependent
+    branches. Returns (point_won, is_ace, is_double_fault).
     """
-    if event == 'win_break':
-        player['momentum'] = clip(player['momentum'] + 1, -3, 3)
-    elif event == 'lose_break':
-        player['momentum'] = clip(player['momentum'] - 1, -3, 3)
-    # Additional events (e.g., winning a tie-break) could also be added.
-    return
+    r = np.random.random()
+    is_df = r < row[T_DF]
+    is_ace = (not is_df) and r < row[T_ACE]
+    point_won = (not is_df) and r < row[T_WIN]  # the ace band sits inside the win band
+    return point_won, is_ace, is_df
 
-# -------------------------------
-# Simulation functions
-# -------------------------------
-def simulate_point(player):
+@njit(cache=True, fastmath=True)
+def simulate_point(eff_table, momentum):
     """
-    Simulate a single point from the perspective of the server.
-    The player's effective stats (daily stats adjusted by momentum) are used.
-    
+    Simulate a single point from the perspective of the server, resolving
+    the momentum row first. Loops should prefer fetching the row once and
+    calling _point_from_row directly — momentum can only change between
+    games, never inside one.
+
     Returns a tuple: (point_won, is_ace, is_double_fault)
     """
-    # Compute effective stats for this point.
-    stats = apply_momentum_to_stats(player['daily_stats'], player['momentum'])
-    
-    df_prob = stats['DoubleFaultPercentage']
-    ace_prob = stats['AcePercentage']
-    first_serve_pct = stats['FirstServePercentage']
-    first_serve_win_pct = stats['FirstServeWonPercentage']
-    second_serve_win_pct = stats['SecondServeWonPercentage']
-
-    roll = random.random()
-    # Check for double fault first.
-    if roll < df_prob:
-        return (False, False, True)
-    
-    # Then check for ace.
-    roll2 = random.random()
-    if roll2 < ace_prob:
-        return (True, True, False)
-    
-    # Otherwise, use a weighted chance based on whether first serve was in.
-    # Assume the server gets first serve with probability first_serve_pct.
-    p_win = first_serve_pct * first_serve_win_pct + (1 - first_serve_pct) * second_serve_win_pct
-    return (random.random() < p_win, False, False)
-
-def simulate_game(server, receiver):
+    return _point_from_row(eff_table[momentum + 3])
+
+@njit(cache=True, fastmath=True)
+def simulate_game(server_table, server_momentum):
     """
-    Simulate a single game.
-    
-    The server and receiver are dictionaries that hold their current daily stats and momentum.
-    Returns a dictionary:
-      {
-         'winner': 'server' or 'receiver',
-         'server_aces': int,
-         'server_double_faults': int
-      }
+    Simulate a single game on the given server's momentum table.
+    Returns a tuple: (server_won, server_aces, server_double_faults)
     """
     server_points = 0
     receiver_points = 0
     server_aces = 0
     server_double_faults = 0
 
+    # Momentum is constant within a game; resolve the threshold row once.
+    row = server_table[server_momentum + 3]
     while True:
-        point_won, is_ace, is_df = simulate_point(server)
+        point_won, is_ace, is_df = _point_from_row(row)
         if point_won:
             server_points += 1
             if is_ace:
@@ -147,31 +191,37 @@ def simulate_game(server, receiver):
             receiver_points += 1
         if is_df:
             server_double_faults += 1
-        
+
         # Check if game is decided (win by 2 and at least 4 points)
         if (server_points >= 4 or receiver_points >= 4) and abs(server_points - receiver_points) >= 2:
-            if server_points > receiver_points:
-                return {'winner': 'server', 'server_aces': server_aces, 'server_double_faults': server_double_faults}
-            else:
-                return {'winner': 'receiver', 'server_aces': server_aces, 'server_double_faults': server_double_faults}
+            return server_points > receiver_points, server_aces, server_double_faults
 
-def simulate_tiebreak(server, receiver):
+@njit(cache=True, fastmath=True)
+def simulate_tiebreak(server_table, server_momentum, receiver_table, receiver_momentum):
     """
     Simulate a tie-break (first to 7, win by 2).
-    Serving rotates: first point by 'server', then every 2 points.
-    Returns a dict similar to simulate_game.
+    Serving rotates: first point by the initial server, then every 2 points.
+    Returns a tuple: (server_won, server_aces, server_double_faults);
+    aces/DFs are tracked only for the initial server, as before.
     """
     server_points = 0
     receiver_points = 0
     server_aces = 0
     server_double_faults = 0
 
-    current_server = 'server'
+    # Momentum is constant within the tie-break; resolve both rows once.
+    server_row = server_table[server_momentum + 3]
+    receiver_row = receiver_table[receiver_momentum + 3]
     point_count = 0
 
     while True:
-        if current_server == 'server':
-            point_won, is_ace, is_df = simulate_point(server)
+        # Standard rotation: the initial server takes point 1, then serve
+        # switches every 2 points (points 2-3, 4-5, ...). For 0-indexed
+        # point p that is ((p + 1) >> 1) & 1 — a shift instead of the old
+        # (and off-by-a-cycle) modulo-4 toggle.
+        server_serving = (((point_count + 1) >> 1) & 1) == 0
+        if server_serving:
+            point_won, is_ace, is_df = _point_from_row(server_row)
             if point_won:
                 server_points += 1
                 if is_ace:
@@ -182,135 +232,89 @@ def simulate_tiebreak(server, receiver):
                 server_double_faults += 1
         else:
             # Receiver serves; use receiver's effective stats.
-            point_won, is_ace, is_df = simulate_point(receiver)
+            point_won, is_ace, is_df = _point_from_row(receiver_row)
             if point_won:
                 receiver_points += 1
             else:
                 server_points += 1
-            # We track aces/DF only for the player whose stats we are tracking (here, for clarity, we track only when a given player is serving).
-        
+
         point_count += 1
-        if point_count == 1 or (point_count > 1 and (point_count - 1) % 4 == 0):
-            current_server = 'receiver' if current_server == 'server' else 'server'
-        
         if (server_points >= 7 or receiver_points >= 7) and abs(server_points - receiver_points) >= 2:
-            if server_points > receiver_points:
-                return {'winner': 'server', 'server_aces': server_aces, 'server_double_faults': server_double_faults}
-            else:
-                return {'winner': 'receiver', 'server_aces': server_aces, 'server_double_faults': server_double_faults}
+            return server_points > receiver_points, server_aces, server_double_faults
 
-def simulate_set(player1, player2, starting_server):
+@njit(cache=True, fastmath=True)
+def simulate_set(table1, momentum1, table2, momentum2, starting_server):
     """
     Simulate one set.
-    
-    'starting_server' is 1 or 2 (which player serves first).
-    Alternates server each game.
-    
-    Returns a dict with set results and cumulative stats:
-      {
-        'winner': player1 or player2,
-        'games_won_by_p1': int,
-        'games_won_by_p2': int,
-        'aces_by_p1': int,
-        'aces_by_p2': int,
-        'df_by_p1': int,
-        'df_by_p2': int
-      }
-    Also updates players' momentum based on break events.
+
+    'starting_server' is 1 or 2 (which player serves first); servers
+    alternate each game. Momentum updates at break events happen here, so
+    the updated values are threaded back to the caller.
+
+    Returns a tuple:
+      (p1_won_set, games_p1, games_p2, aces_p1, aces_p2, df_p1, df_p2,
+       momentum1, momentum2)
     """
-    games_p1 = 0
-    games_p2 = 0
-    aces_p1 = 0
-    aces_p2 = 0
-    df_p1 = 0
-    df_p2 = 0
+    # Index the per-player tallies by server slot (0 = player1, 1 = player2)
+    # so one code path covers both serving orders instead of two mirrored
+    # branches that must be kept in sync.
+    games = np.zeros(2, dtype=np.int64)
+    aces = np.zeros(2, dtype=np.int64)
+    dfs = np.zeros(2, dtype=np.int64)
+    momentum = np.empty(2, dtype=np.int64)
+    momentum[0] = momentum1
+    momentum[1] = momentum2
 
-    next_server = starting_server
+    srv = starting_server - 1
 
     while True:
-        if next_server == 1:
-            # Player1 serves; if server wins, that's a hold.
-            game_info = simulate_game(player1, player2)
-            if game_info['winner'] == 'server':
-                games_p1 += 1
-            else:
-                games_p2 += 1
-                # Break: update momentum: receiver (player2) gains; server (player1) loses.
-                update_momentum(player2, 'win_break')
-                update_momentum(player1, 'lose_break')
-            aces_p1 += game_info['server_aces']
-            df_p1 += game_info['server_double_faults']
+        rcv = 1 - srv
+        table = table1 if srv == 0 else table2
+        server_won, game_aces, game_dfs = simulate_game(table, momentum[srv])
+        if server_won:
+            games[srv] += 1
         else:
-            # Player2 serves.
-            game_info = simulate_game(player2, player1)
-            if game_info['winner'] == 'server':
-                games_p2 += 1
-            else:
-                games_p1 += 1
-                update_momentum(player1, 'win_break')
-                update_momentum(player2, 'lose_break')
-            aces_p2 += game_info['server_aces']
-            df_p2 += game_info['server_double_faults']
+            # Break: receiver gains momentum; server loses it.
+            games[rcv] += 1
+            momentum[rcv] = min(momentum[rcv] + 1, 3)
+            momentum[srv] = max(momentum[srv] - 1, -3)
+        aces[srv] += game_aces
+        dfs[srv] += game_dfs
 
         # Check if set is won (6+ games with at least 2-game lead)
-        if (games_p1 >= 6 or games_p2 >= 6) and abs(games_p1 - games_p2) >= 2:
-            winner = player1 if games_p1 > games_p2 else player2
-            return {
-                'winner': winner,
-                'games_won_by_p1': games_p1,
-                'games_won_by_p2': games_p2,
-                'aces_by_p1': aces_p1,
-                'aces_by_p2': aces_p2,
-                'df_by_p1': df_p1,
-                'df_by_p2': df_p2
-            }
-        
+        if (games[0] >= 6 or games[1] >= 6) and abs(games[0] - games[1]) >= 2:
+            return (games[0] > games[1], games[0], games[1],
+                    aces[0], aces[1], dfs[0], dfs[1], momentum[0], momentum[1])
+
         # Tie-break if 6-6
-        if games_p1 == 6 and games_p2 == 6:
-            if next_server == 1:
-                tb_info = simulate_tiebreak(player1, player2)
-                aces_p1 += tb_info['server_aces']
-                df_p1 += tb_info['server_double_faults']
-                if tb_info['winner'] == 'server':
-                    games_p1 += 1
-                else:
-                    games_p2 += 1
-                    update_momentum(player2, 'win_break')
-                    update_momentum(player1, 'lose_break')
+        if games[0] == 6 and games[1] == 6:
+            rcv_table = table2 if srv == 0 else table1
+            server_won, game_aces, game_dfs = simulate_tiebreak(
+                table, momentum[srv], rcv_table, momentum[rcv])
+            aces[srv] += game_aces
+            dfs[srv] += game_dfs
+            if server_won:
+                games[srv] += 1
             else:
-                tb_info = simulate_tiebreak(player2, player1)
-                aces_p2 += tb_info['server_aces']
-                df_p2 += tb_info['server_double_faults']
-                if tb_info['winner'] == 'server':
-                    games_p2 += 1
-                else:
-                    games_p1 += 1
-                    update_momentum(player1, 'win_break')
-                    update_momentum(player2, 'lose_break')
-            winner = player1 if games_p1 > games_p2 else player2
-            return {
-                'winner': winner,
-                'games_won_by_p1': games_p1,
-                'games_won_by_p2': games_p2,
-                'aces_by_p1': aces_p1,
-                'aces_by_p2': aces_p2,
-                'df_by_p1': df_p1,
-                'df_by_p2': df_p2
-            }
-        
-        next_server = 1 if next_server == 2 else 2
+                games[rcv] += 1
+                momentum[rcv] = min(momentum[rcv] + 1, 3)
+                momentum[srv] = max(momentum[srv] - 1, -3)
+            return (games[0] > games[1], games[0], games[1],
+                    aces[0], aces[1], dfs[0], dfs[1], momentum[0], momentum[1])
+
+        srv = rcv
 
 def simulate_match(player1, player2, best_of=3):
     """
     Simulate a best-of-3 match.
-    
+
     Each player dictionary should have these keys:
       - name
       - base_stats (their long-term baseline stats)
       - daily_stats (set at match start via generate_daily_stats)
       - momentum (starting at 0)
       - breaks (ephemeral, used for extra stat tracking)
-    
+
     Returns two dictionaries with final match tallies for player1 and player2.
     """
     # Initialize match stats for each player.
@@ -330,37 +334,47 @@ def simulate_match(player1, player2, best_of=3):
         'breaks': 0,
         'clean_sets': 0,
     }
-    
+
     # Each match, players start with momentum = 0.
-    player1['momentum'] = 0
-    player2['momentum'] = 0
-    
-    # Generate today's stats for each player.
+    momentum1 = 0
+    momentum2 = 0
+    player1['momentum'] = momentum1
+    player2['momentum'] = momentum2
+
+    # Generate today's stats for each player and pack them once into the
+    # flat arrays the jitted kernels consume.
     player1['daily_stats'] = generate_daily_stats(player1['base_stats'])
     player2['daily_stats'] = generate_daily_stats(player2['base_stats'])
-    
+    table1 = momentum_table(player1['daily_stats'])
+    table2 = momentum_table(player2['daily_stats'])
+
     # Determine how many sets to win.
     sets_to_win = best_of // 2 + 1
     next_set_server = 1  # alternate set starting server.
-    
+
     while p1_stats['sets_won'] < sets_to_win and p2_stats['sets_won'] < sets_to_win:
-        set_result = simulate_set(player1, player2, next_set_server)
+        (p1_won_set, games_p1, games_p2, aces_p1, aces_p2,
+         df_p1, df_p2, momentum1, momentum2) = simulate_set(
+            table1, momentum1, table2, momentum2, next_set_server)
         # Update game, aces, and DF counts.
-        p1_stats['games_won'] += set_result['games_won_by_p1']
-        p2_stats['games_won'] += set_result['games_won_by_p2']
-        p1_stats['aces'] += set_result['aces_by_p1']
-        p2_stats['aces'] += set_result['aces_by_p2']
-        p1_stats['double_faults'] += set_result['df_by_p1']
-        p2_stats['double_faults'] += set_result['df_by_p2']
-        
-        if set_result['winner'] == player1:
+        p1_stats['games_won'] += games_p1
+        p2_stats['games_won'] += games_p2
+        p1_stats['aces'] += aces_p1
+        p2_stats['aces'] += aces_p2
+        p1_stats['double_faults'] += df_p1
+        p2_stats['double_faults'] += df_p2
+
+        if p1_won_set:
             p1_stats['sets_won'] += 1
             # (Clean set bonus logic could be added here.)
         else:
             p2_stats['sets_won'] += 1
-        
+
         next_set_server = 1 if next_set_server == 2 else 2
-    
+
+    player1['momentum'] = momentum1
+    player2['momentum'] = momentum2
+
     # Determine match winner.
     if p1_stats['sets_won'] > p2_stats['sets_won']:
         p1_stats['match_won'] = True
@@ -368,68 +382,162 @@ def simulate_match(player1, player2, best_of=3):
     else:
         p2_stats['match_won'] = True
         p1_stats['match_won'] = False
-    
+
     # For simplicity, we set sets_lost and games_lost.
     p1_stats['sets_lost'] = p2_stats['sets_won']
     p2_stats['sets_lost'] = p1_stats['sets_won']
     p1_stats['games_lost'] = p2_stats['games_won']
     p2_stats['games_lost'] = p1_stats['games_won']
-    
+
     return p1_stats, p2_stats
 
-def calculate_draftkings_score(stats, best_of=3):
+@njit(cache=True, fastmath=True)
+def _daily_from_base(base):
     """
-    Calculates the DraftKings fantasy score for a player given their match stats,
-    assuming best-of-3 scoring.
+    Jitted counterpart of generate_daily_stats operating on the packed base
+    array, so the whole match can run without leaving compiled code.
     """
-    # Scoring rules for best-of-3.
-    match_played_pts = 30
-    game_won_pts = 2.5
-    game_lost_pts = -2
-    set_won_pts = 6
-    set_lost_pts = -3
-    match_won_pts = 6
-    ace_pts = 0.4
-    df_pts = -1
-    break_pts = 0.75
-
-    # Bonuses
-    clean_set_bonus = 4
-    straight_sets_bonus = 6
-    no_df_bonus = 2.5
-    milestone_10_aces = 2
-
-    sets_won = stats['sets_won']
-    sets_lost = stats['sets_lost']
-    games_won = stats['games_won']
-    games_lost = stats['games_lost']
-    aces = stats['aces']
-    double_faults = stats['double_faults']
-    # For simplicity, breaks are not separately tallied here.
-    match_won = stats['match_won']
-    clean_sets = stats['clean_sets']
-
-    points = 0
-    points += match_played_pts
-    points += games_won * game_won_pts
-    points += games_lost * game_lost_pts
-    points += sets_won * set_won_pts
-    points += sets_lost * set_lost_pts
+    serve_form = 1.0 + 0.1 * np.random.standard_normal()
+    serve_form = min(max(serve_form, 0.7), 1.3)
+    return_form = 1.0 + 0.1 * np.random.standard_normal()
+    return_form = min(max(return_form, 0.7), 1.3)
+
+    daily = np.empty(N_DAILY)
+    daily[ACE] = min(base[ACE] * serve_form, 1.0)
+    daily[DF] = min(base[DF] / serve_form, 1.0)
+    daily[FSP] = base[FSP]
+    daily[FSW] = min(base[FSW] * serve_form, 1.0)
+    daily[SSW] = min(base[SSW] * serve_form, 1.0)
+    daily[RPW] = min(base[RPW] * return_form, 1.0)
+    daily[BPC] = min(base[BPC] * return_form, 1.0)
+    return daily
+
+@njit(cache=True, fastmath=True)
+def _simulate_match_bo3(base1, base2):
+    """
+    Fully jitted best-of-3 match: daily-stat generation, sets, games and
+    points all run in compiled code with no dict traffic. The only callers
+    simulate best-of-3, so sets_to_win is folded to the literal 2 and the
+    loop guard needs no parameter. Returns the raw tallies
+    (sets1, sets2, games1, games2, aces1, aces2, df1, df2).
+    """
+    table1 = momentum_table(_daily_from_base(base1))
+    table2 = momentum_table(_daily_from_base(base2))
+    momentum1 = 0
+    momentum2 = 0
+    sets1 = 0
+    sets2 = 0
+    games1 = 0
+    games2 = 0
+    aces1 = 0
+    aces2 = 0
+    df1 = 0
+    df2 = 0
+    next_server = 1
+    while sets1 < 2 and sets2 < 2:
+        (p1_won_set, g1, g2, a1, a2, d1, d2, momentum1, momentum2) = simulate_set(
+            table1, momentum1, table2, momentum2, next_server)
+        games1 += g1
+        games2 += g2
+        aces1 += a1
+        aces2 += a2
+        df1 += d1
+        df2 += d2
+        if p1_won_set:
+            sets1 += 1
+        else:
+            sets2 += 1
+        next_server = 1 if next_server == 2 else 2
+    return sets1, sets2, games1, games2, aces1, aces2, df1, df2
+
+@njit(cache=True)
+def _dk_score(sets_won, sets_lost, games_won, games_lost, aces, double_faults,
+              match_won, clean_sets):
+    """Scalar best-of-3 DraftKings scoring over plain ints (jit-friendly)."""
+    points = MATCH_PLAYED_PTS
+    points += games_won * GAME_WON_PTS
+    points += games_lost * GAME_LOST_PTS
+    points += sets_won * SET_WON_PTS
+    points += sets_lost * SET_LOST_PTS
     if match_won:
-        points += match_won_pts
-    points += aces * ace_pts
-    points += double_faults * df_pts
-    points += break_pts * 0  # (Breaks bonus could be added if tracked.)
-    points += clean_sets * clean_set_bonus
+        points += MATCH_WON_PTS
+    points += aces * ACE_PTS
+    points += double_faults * DF_PTS
+    points += clean_sets * CLEAN_SET_BONUS
     if match_won and sets_lost == 0:
-        points += straight_sets_bonus
+        points += STRAIGHT_SETS_BONUS
     if double_faults == 0:
-        points += no_df_bonus
+        points += NO_DF_BONUS
     if aces >= 10:
-        points += milestone_10_aces
-
+        points += MILESTONE_10_ACES
     return points
 
+@njit(parallel=True)
+def simulate_many(n, base1, base2, out1, out2):
+    """
+    Run n independent matches in parallel (numba prange over the match
+    index; plain range without numba) and write each player's DraftKings
+    score into the preallocated out arrays. Matches are embarrassingly
+    parallel and allocation-free, so this scales with core count.
+    """
+    for i in prange(n):
+        sets1, sets2, g1, g2, a1, a2, d1, d2 = _simulate_match_bo3(base1, base2)
+        out1[i] = _dk_score(sets1, sets2, g1, g2, a1, d1, sets1 > sets2, 0)
+        out2[i] = _dk_score(sets2, sets1, g2, g1, a2, d2, sets2 > sets1, 0)
+
+@njit(cache=True)
+def _seed_kernels(seed):
+    """
+    Seed the random state the jitted kernels actually draw from. Under
+    numba, np.random.seed called from plain Python only seeds NumPy's
+    generator — the compiled kernels keep their own internal state, which
+    this jitted call is the documented way to reach. Without numba this
+    compiles to a plain function and seeds NumPy directly.
+    """
+    np.random.seed(seed)
+
+def _run_one(args):
+    """Pool worker: seed an independent stream, run one match, score it."""
+    seed_seq, base1, base2 = args
+    _seed_kernels(seed_seq.generate_state(1, np.uint32)[0])
+    sets1, sets2, g1, g2, a1, a2, d1, d2 = _simulate_match_bo3(base1, base2)
+    return (_dk_score(sets1, sets2, g1, g2, a1, d1, sets1 > sets2, 0),
+            _dk_score(sets2, sets1, g2, g1, a2, d2, sets2 > sets1, 0))
+
+def run_many_pool(n, base1, base2, workers=None, seed=None):
+    """
+    Multiprocessing alternative to simulate_many: the n independent,
+    CPU-bound matches are chunked across a process pool, with chunksize
+    sized to amortize the per-task IPC overhead (cheap sims die by spawn
+    cost otherwise). Per-match seeds come from SeedSequence.spawn, which
+    hashes each child stream apart so worker streams never collide; with
+    a fixed seed, results are reproducible per match (and thus for the
+    whole run) regardless of worker count, on a given numba/NumPy setup.
+    Returns (player1_scores, player2_scores) arrays.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    children = np.random.SeedSequence(seed).spawn(n)
+    jobs = [(child, base1, base2) for child in children]
+    chunksize = max(1, n // (workers * 4))
+    with Pool(workers) as pool:
+        results = pool.map(_run_one, jobs, chunksize=chunksize)
+    scores = np.array(results)
+    return scores[:, 0], scores[:, 1]
+
+def calculate_draftkings_score(stats, best_of=3):
+    """
+    Calculates the DraftKings fantasy score for a player given their match stats,
+    assuming best-of-3 scoring. Thin dict adapter over the jitted _dk_score.
+    """
+    # For simplicity, breaks are not separately tallied here.
+    return _dk_score(
+        stats['sets_won'], stats['sets_lost'],
+        stats['games_won'], stats['games_lost'],
+        stats['aces'], stats['double_faults'],
+        stats['match_won'], stats['clean_sets'],
+    )
+
 # -------------------------------
 # Main simulation loop
 # -------------------------------
@@ -485,34 +593,32 @@ if __name__ == "__main__":
         'BreakPointsConvertedPercentage': 0.4199
     }
 
-    # Set up player dictionaries. Each player starts with their base stats.
-    N = 100  # Number of simulations
-    sinner_dk_sum = 0.0
-    alcaraz_dk_sum = 0.0
-
-    for _ in range(N):
-        # Create fresh player dictionaries (ephemeral properties are reset each match).
-        player1 = {
-            'name': 'Jannik Sinner',
-            'base_stats': sinner_base_stats,
-            'momentum': 0,   # will be set in simulate_match
-            'daily_stats': {},  # will be generated at match start
-            'breaks': 0
-        }
-        player2 = {
-            'name': 'Carlos Alcaraz',
-            'base_stats': alcaraz_base_stats,
-            'momentum': 0,
-            'daily_stats': {},
-            'breaks': 0
-        }
-        
-        p1_res, p2_res = simulate_match(player1, player2, best_of=3)
-        p1_dk = calculate_draftkings_score(p1_res, best_of=3)
-        p2_dk = calculate_draftkings_score(p2_res, best_of=3)
-        sinner_dk_sum += p1_dk
-        alcaraz_dk_sum += p2_dk
+    import argparse
+    parser = argparse.ArgumentParser(description="Monte Carlo best-of-3 tennis simulator")
+    parser.add_argument("-n", "--num-sims", type=int, default=100,
+                        help="number of matches to simulate")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="process count for the multiprocessing path; "
+                             "0 runs the in-process (numba-parallel) loop")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="root seed for the multiprocessing path; "
+                             "fixing it makes the whole run reproducible")
+    args = parser.parse_args()
+
+    # Pack the base stats once; every match draws its own daily variation
+    # from these arrays inside the jitted kernels.
+    N = args.num_sims
+    sinner_base = daily_stats_array(sinner_base_stats)
+    alcaraz_base = daily_stats_array(alcaraz_base_stats)
+
+    if args.workers:
+        sinner_dk, alcaraz_dk = run_many_pool(N, sinner_base, alcaraz_base,
+                                              args.workers, args.seed)
+    else:
+        sinner_dk = np.empty(N)
+        alcaraz_dk = np.empty(N)
+        simulate_many(N, sinner_base, alcaraz_base, sinner_dk, alcaraz_dk)
 
     print(f"After {N} best-of-3 simulations with daily variance and momentum:")
-    print(f"Average DK Score for Jannik Sinner: {sinner_dk_sum / N:.2f}")
-    print(f"Average DK Score for Carlos Alcaraz: {alcaraz_dk_sum / N:.2f}")
+    print(f"Average DK Score for Jannik Sinner: {sinner_dk.mean():.2f}")
+    print(f"Average DK Score for Carlos Alcaraz: {alcaraz_dk.mean():.2f}")
@@ -31,15 +31,133 @@
 # defensive metric (return_RiPW) and an Elo factor.
 
 import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Numba is optional: with it installed the flat-array point kernels below
+# compile to machine code; without it they run as plain Python.
+try:
+    from numba import njit, prange
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+    prange = range
 
 # Global league parameters
 LEAGUE_AVG_ELO = 1500
 ELO_ADJUSTMENT_FACTOR = 0.05  # Sensitivity constant for Elo adjustments
+# Folded constant so Elo factors cost one multiply and one add instead of
+# also dividing by the league average on every computation.
+ELO_K = ELO_ADJUSTMENT_FACTOR / LEAGUE_AVG_ELO
+
+# Rally-length brackets as parallel arrays (cumulative probabilities plus
+# shot-count bounds) so batch code can pick brackets with one searchsorted
+# and gather per-bracket values by index.
+RALLY_BRACKET_CUM = np.array([0.30, 0.70, 0.90, 1.00])
+RALLY_BRACKET_LOWS = np.array([1, 4, 7, 10])
+RALLY_BRACKET_HIGHS = np.array([3, 6, 9, 15])
+
+# Integer bracket IDs (rows of the arrays above): small ints index
+# straight into tuples and arrays, where the old "1-3"-style string
+# labels forced hashing on every lookup.
+BRACKET_1_3 = 0
+BRACKET_4_6 = 1
+BRACKET_7_9 = 2
+BRACKET_10PLUS = 3
+N_BRACKETS = 4
+
+# Column offsets for the flat per-player stat vector the jitted kernels
+# consume (order matches _STAT_KEYS below).
+FIRST_SERVE_IN = 0
+ACE_1ST = 1
+ACE_2ND = 2
+DOUBLE_FAULT = 3
+SNV_FREQ = 4
+SNV_WIN = 5
+RALLY_1_3 = 6
+RALLY_4_6 = 7
+RALLY_7_9 = 8
+RALLY_10PLUS = 9
+ACE_AGAINST = 10
+RETURN_RIPW = 11
+N_STATS = 12
+
+_STAT_KEYS = (
+    'first_serve_in_pct',
+    'ace_rate_1st',
+    'ace_rate_2nd',
+    'double_fault_pct',
+    'serve_and_volley_freq',
+    'serve_and_volley_win_pct',
+    'rally_1_3_win',
+    'rally_4_6_win',
+    'rally_7_9_win',
+    'rally_10plus_win',
+    'ace_rate_against',
+    'return_RiPW',
+)
+
+# Offsets into the flat event-count arrays (order matches the point_stats
+# labels in TennisPlayer).
+ACES = 0
+DFS = 1
+SNV_W = 2
+SNV_L = 3
+PTS_SERVE = 4
+RALLY_W_SRV = 5
+RALLY_W_RCV = 6
+N_COUNTS = 7
+
+# Human-readable labels for the count offsets, for summary printing.
+POINT_STAT_LABELS = (
+    'Aces',
+    'Double Faults',
+    'Serve & Volley Wins',
+    'Serve & Volley Losses',
+    'Points Won on Serve',
+    'Rally Wins as Server',
+    'Rally Wins as Receiver',
+)
+
+# Module-level PCG64 generator plus a buffered scalar-uniform helper for the
+# pure-Python path: PCG64 is faster per draw than the stdlib Mersenne
+# Twister, and refilling a large buffer in one bulk call amortizes the
+# Generator call overhead across thousands of scalar draws.
+_RNG = np.random.default_rng()
+
+class _UniformBuffer:
+    """Hands out scalar uniforms from a bulk-drawn NumPy buffer."""
+
+    def __init__(self, size=65536):
+        self._size = size
+        self._buf = _RNG.random(size, dtype=np.float32)
+        self._i = 0
+
+    def next_uniform(self):
+        if self._i == self._size:
+            self._buf = _RNG.random(self._size, dtype=np.float32)
+            self._i = 0
+        v = self._buf[self._i]
+        self._i += 1
+        return v
+
+next_uniform = _UniformBuffer().next_uniform
 
 # ---------------------------------------------------------------------------
 # TennisPlayer: Holds a player's attributes and tracks point-level events.
 # ---------------------------------------------------------------------------
 class TennisPlayer:
+    # No instance dict: attribute slots cut per-player memory and shave
+    # the lookup cost that adds up when simulating many matchups.
+    __slots__ = ('name', 'elo', 'stats', 'point_stats')
+
     def __init__(self, name, elo, stats):
         """
         :param name: str, player's name.
@@ -49,182 +167,499 @@ class TennisPlayer:
         self.name = name
         self.elo = elo
         self.stats = stats
-        # Track events during simulation.
-        # We record rally wins separately depending on serving or receiving.
-        self.point_stats = {
-            'Aces': 0,
-            'Double Faults': 0,
-            'Serve & Volley Wins': 0,
-            'Serve & Volley Losses': 0,
-            'Points Won on Serve': 0,         # Immediate wins when serving (ace or S&V win)
-            'Rally Wins as Server': 0,         # Rally wins when serving
-            'Rally Wins as Receiver': 0,       # Rally wins when receiving
-        }
+        # Track events during simulation as a flat int64 array indexed by
+        # the module-level count offsets (ACES, DFS, ...): each increment
+        # is a single native memory op instead of a dict hash lookup, and
+        # the layout is what the jitted kernels consume directly. Rally
+        # wins are recorded separately for serving and receiving.
+        self.point_stats = np.zeros(N_COUNTS, dtype=np.int32)
+
+    def point_stats_dict(self):
+        """Labeled view of the event counts, for printing."""
+        return dict(zip(POINT_STAT_LABELS, self.point_stats.tolist()))
 
 # ---------------------------------------------------------------------------
 # ServeSimulator: Handles first and second serve simulations with Elo adjustments.
 # ---------------------------------------------------------------------------
-# In ServeSimulator.simulate_first_serve, replace the effective ace calculation with:
 class ServeSimulator:
-    @staticmethod
-    def simulate_first_serve(server: TennisPlayer, receiver: TennisPlayer):
-        if random.random() * 100 < server.stats['first_serve_in_pct']:
-            # First serve is in.
-            base_ace = server.stats['ace_rate_1st']
-            elo_factor = 1 + ELO_ADJUSTMENT_FACTOR * ((server.elo - receiver.elo) / LEAGUE_AVG_ELO)
-            # Instead of subtracting the full receiver's defensive stat, subtract only half,
-            # and then multiply by a random variance factor (e.g., between 0.9 and 1.1).
-            effective_ace_chance = base_ace * elo_factor - 0.5 * receiver.stats.get('ace_rate_against', 0)
-            variance = random.uniform(0.9, 1.1)
-            effective_ace_chance *= variance
-            # Ensure a floor so that there is always at least a small chance (e.g., 0.5%).
-            effective_ace_chance = max(0.5, effective_ace_chance)
-            if random.random() * 100 < effective_ace_chance:
-                server.point_stats['Aces'] += 1
+    """
+    Per-matchup serve simulator. Server, receiver, and stats never change
+    across a simulation run, so the Elo factor, the half-receiver ace
+    corrections, and the unit-normalized probabilities are all computed
+    once here; the per-point methods only draw randoms and compare.
+    """
+
+    def __init__(self, server: TennisPlayer, receiver: TennisPlayer):
+        self.server = server
+        elo_factor = 1.0 + ELO_K * (server.elo - receiver.elo)
+        opp_ace = receiver.stats.get('ace_rate_against', 0)
+        self.first_in_p = server.stats['first_serve_in_pct'] / 100.0
+        # Ace centers: the per-point 0.9-1.1 variance multiplies these.
+        self.ace1_center = server.stats['ace_rate_1st'] * elo_factor - 0.5 * opp_ace
+        self.ace2_center = server.stats['ace_rate_2nd'] * elo_factor - 0.5 * opp_ace
+        self.df_p = server.stats['double_fault_pct'] / 100.0
+        self.snv_freq_p = server.stats['serve_and_volley_freq'] * elo_factor / 100.0
+        self.snv_win_p = server.stats['serve_and_volley_win_pct'] * elo_factor / 100.0
+
+    # The hot methods bind the buffered uniform helper as a default
+    # argument: CPython resolves a default in one LOAD_FAST instead of a
+    # module-global plus attribute lookup per call, and every draw comes
+    # from the bulk-refilled PCG64 buffer.
+    def simulate_first_serve(self, _rand=next_uniform):
+        if _rand() < self.first_in_p:
+            # First serve is in; apply the per-point variance to the
+            # precomputed ace center, with a 0.5% floor.
+            effective_ace_chance = max(0.5, self.ace1_center * (0.9 + 0.2 * _rand()))
+            if _rand() * 100 < effective_ace_chance:
+                self.server.point_stats[ACES] += 1
                 return 'ace'
             # Check serve-and-volley option.
-            base_snv_freq = server.stats['serve_and_volley_freq']
-            effective_snv_freq = base_snv_freq * elo_factor
-            if random.random() * 100 < effective_snv_freq:
-                base_snv_win = server.stats['serve_and_volley_win_pct']
-                effective_snv_win = base_snv_win * elo_factor
-                if random.random() * 100 < effective_snv_win:
-                    server.point_stats['Serve & Volley Wins'] += 1
+            if _rand() < self.snv_freq_p:
+                if _rand() < self.snv_win_p:
+                    self.server.point_stats[SNV_W] += 1
                     return 'serve_and_volley_win'
                 else:
-                    server.point_stats['Serve & Volley Losses'] += 1
+                    self.server.point_stats[SNV_L] += 1
                     return 'serve_and_volley_loss'
             return 'in_play'
         else:
             return None  # First serve fault.
 
-    @staticmethod
-    def simulate_second_serve(server: TennisPlayer, receiver: TennisPlayer):
-        if random.random() * 100 < server.stats['double_fault_pct']:
-            server.point_stats['Double Faults'] += 1
+    def simulate_second_serve(self, _rand=next_uniform):
+        if _rand() < self.df_p:
+            self.server.point_stats[DFS] += 1
             return 'double_fault'
-        base_ace_2nd = server.stats['ace_rate_2nd']
-        elo_factor = 1 + ELO_ADJUSTMENT_FACTOR * ((server.elo - receiver.elo) / LEAGUE_AVG_ELO)
-        effective_ace_chance_2nd = base_ace_2nd * elo_factor - 0.5 * receiver.stats.get('ace_rate_against', 0)
-        variance = random.uniform(0.9, 1.1)
-        effective_ace_chance_2nd *= variance
-        effective_ace_chance_2nd = max(0.5, effective_ace_chance_2nd)
-        if random.random() * 100 < effective_ace_chance_2nd:
-            server.point_stats['Aces'] += 1
+        effective_ace_chance_2nd = max(0.5, self.ace2_center * (0.9 + 0.2 * _rand()))
+        if _rand() * 100 < effective_ace_chance_2nd:
+            self.server.point_stats[ACES] += 1
             return 'ace_2nd'
         return 'in_play'
 # ---------------------------------------------------------------------------
 # RallySimulator: Handles simulation of the rally phase using a weighted rally-length distribution.
 # ---------------------------------------------------------------------------
 class RallySimulator:
-    @staticmethod
-    def simulate_rally(server: TennisPlayer, receiver: TennisPlayer):
-        # Define rally-length brackets: (label, low, high, probability)
-        brackets = [
-            ("1-3", 1, 3, 0.30),
-            ("4-6", 4, 6, 0.40),
-            ("7-9", 7, 9, 0.20),
-            ("10+", 10, 15, 0.10)
-        ]
-        r = random.random()
-        cumulative = 0
-        selected_bracket = None
-        for label, low, high, prob in brackets:
-            cumulative += prob
-            if r < cumulative:
-                selected_bracket = (label, low, high)
-                break
-        if selected_bracket is None:
-            selected_bracket = ("10+", 10, 15)
-        label, low, high = selected_bracket
-        rally_length = random.randint(low, high)
-        # Choose base rally win % from server's stats based on bracket.
-        if label == "1-3":
-            base_rally_win = server.stats['rally_1_3_win']
-        elif label == "4-6":
-            base_rally_win = server.stats['rally_4_6_win']
-        elif label == "7-9":
-            base_rally_win = server.stats['rally_7_9_win']
-        else:
-            base_rally_win = server.stats['rally_10plus_win']
+    """
+    Per-matchup rally simulator: the effective rally-win probability for
+    each length bracket is computed once at construction (receiver defense
+    and Elo factor folded in), so the per-point path reduces to a bracket
+    draw, a length draw, and one comparison.
+    """
+
+    # Cumulative bracket weights (BRACKET_* ID order) for random.choices.
+    CUM_WEIGHTS = (0.30, 0.70, 0.90, 1.00)
+    # Length bounds per bracket ID.
+    LOWS = (1, 4, 7, 10)
+    HIGHS = (3, 6, 9, 15)
+
+    def __init__(self, server: TennisPlayer, receiver: TennisPlayer):
+        self.server = server
+        self.receiver = receiver
+        elo_factor = 1.0 + ELO_K * (server.elo - receiver.elo)
         receiver_defense = 100 - receiver.stats.get('return_RiPW', 50)
-        elo_factor = 1 + ELO_ADJUSTMENT_FACTOR * ((server.elo - receiver.elo) / LEAGUE_AVG_ELO)
-        effective_rally_win = ((base_rally_win + receiver_defense) / 2) * elo_factor / 100.0
-        if random.random() < effective_rally_win:
-            return server.name, rally_length
+        # Effective win probability per bracket ID.
+        self.rally_win_p = tuple(
+            ((server.stats[key] + receiver_defense) / 2) * elo_factor / 100.0
+            for key in ('rally_1_3_win', 'rally_4_6_win',
+                        'rally_7_9_win', 'rally_10plus_win')
+        )
+        self._bracket_buf = []
+
+    def simulate_rally(self, _rand=next_uniform, _randint=random.randint):
+        # random.choices runs the cumulative-weight binary search in C;
+        # drawing bracket IDs a few hundred at a time amortizes the call
+        # overhead over that many rallies.
+        if not self._bracket_buf:
+            self._bracket_buf = random.choices(
+                range(N_BRACKETS), cum_weights=self.CUM_WEIGHTS, k=512)
+        b = self._bracket_buf.pop()
+        rally_length = _randint(self.LOWS[b], self.HIGHS[b])
+        if _rand() < self.rally_win_p[b]:
+            return self.server.name, rally_length
         else:
-            return receiver.name, rally_length
+            return self.receiver.name, rally_length
 
 # ---------------------------------------------------------------------------
 # PointSimulator: Integrates serve and rally phases to simulate a complete point.
 # ---------------------------------------------------------------------------
 class PointSimulator:
-    @staticmethod
-    def simulate_point(server: TennisPlayer, receiver: TennisPlayer):
-        outcome = ServeSimulator.simulate_first_serve(server, receiver)
+    """
+    Integrates serve and rally phases for one fixed (server, receiver)
+    ordering; construct once per matchup so the phase simulators'
+    precomputed probabilities are reused across every point.
+    """
+
+    def __init__(self, server: TennisPlayer, receiver: TennisPlayer):
+        self.server = server
+        self.receiver = receiver
+        self.serve = ServeSimulator(server, receiver)
+        self.rally = RallySimulator(server, receiver)
+
+    def simulate_point(self):
+        outcome = self.serve.simulate_first_serve()
         if outcome is None:
-            outcome = ServeSimulator.simulate_second_serve(server, receiver)
+            outcome = self.serve.simulate_second_serve()
         if outcome in ['ace', 'ace_2nd', 'serve_and_volley_win']:
-            server.point_stats['Points Won on Serve'] += 1
-            return server.name
+            self.server.point_stats[PTS_SERVE] += 1
+            return self.server.name
         elif outcome in ['double_fault', 'serve_and_volley_loss']:
-            return receiver.name
+            return self.receiver.name
         else:
-            rally_winner, _ = RallySimulator.simulate_rally(server, receiver)
-            if rally_winner == server.name:
-                server.point_stats['Rally Wins as Server'] += 1
+            rally_winner, _ = self.rally.simulate_rally()
+            if rally_winner == self.server.name:
+                self.server.point_stats[RALLY_W_SRV] += 1
             else:
-                receiver.point_stats['Rally Wins as Receiver'] += 1
+                self.receiver.point_stats[RALLY_W_RCV] += 1
             return rally_winner
 
+# ---------------------------------------------------------------------------
+# make_point_kernel: closure-specialized scalar point kernel.
+# ---------------------------------------------------------------------------
+# Cache of built kernels keyed by the matchup's object identities; callers
+# must keep the players alive for as long as they use the kernel.
+_KERNEL_CACHE = {}
+
+def make_point_kernel(server: TennisPlayer, receiver: TennisPlayer):
+    """
+    Build a zero-argument point kernel specialized for one (server,
+    receiver) ordering. Every probability — Elo factor, ace centers,
+    serve-and-volley rates, per-bracket rally win rates — is baked into
+    the closure as a captured local, so simulating a point is nothing but
+    uniform draws compared against constants plus counter increments.
+    Returns 1 when the server wins the point, else 0.
+    """
+    key = (id(server), id(receiver))
+    kernel = _KERNEL_CACHE.get(key)
+    if kernel is not None:
+        return kernel
+
+    elo_factor = 1.0 + ELO_K * (server.elo - receiver.elo)
+    opp_ace = receiver.stats.get('ace_rate_against', 0)
+    first_in_p = server.stats['first_serve_in_pct'] / 100.0
+    ace1_center = server.stats['ace_rate_1st'] * elo_factor - 0.5 * opp_ace
+    ace2_center = server.stats['ace_rate_2nd'] * elo_factor - 0.5 * opp_ace
+    df_p = server.stats['double_fault_pct'] / 100.0
+    snv_freq_p = server.stats['serve_and_volley_freq'] * elo_factor / 100.0
+    snv_win_p = server.stats['serve_and_volley_win_pct'] * elo_factor / 100.0
+    receiver_defense = 100 - receiver.stats.get('return_RiPW', 50)
+    rally_win_p = tuple(
+        ((server.stats[k] + receiver_defense) / 2) * elo_factor / 100.0
+        for k in ('rally_1_3_win', 'rally_4_6_win',
+                  'rally_7_9_win', 'rally_10plus_win')
+    )
+    server_counts = server.point_stats
+    receiver_counts = receiver.point_stats
+
+    def kernel(_rand=next_uniform, _max=max):
+        # --- Serve ---
+        if _rand() < first_in_p:
+            if _rand() * 100 < _max(0.5, ace1_center * (0.9 + 0.2 * _rand())):
+                server_counts[ACES] += 1
+                server_counts[PTS_SERVE] += 1
+                return 1
+            if _rand() < snv_freq_p:
+                if _rand() < snv_win_p:
+                    server_counts[SNV_W] += 1
+                    server_counts[PTS_SERVE] += 1
+                    return 1
+                server_counts[SNV_L] += 1
+                return 0
+        else:
+            if _rand() < df_p:
+                server_counts[DFS] += 1
+                return 0
+            if _rand() * 100 < _max(0.5, ace2_center * (0.9 + 0.2 * _rand())):
+                server_counts[ACES] += 1
+                server_counts[PTS_SERVE] += 1
+                return 1
+        # --- Rally ---
+        r = _rand()
+        i = (r >= 0.30) + (r >= 0.70) + (r >= 0.90)
+        if _rand() < rally_win_p[i]:
+            server_counts[RALLY_W_SRV] += 1
+            return 1
+        receiver_counts[RALLY_W_RCV] += 1
+        return 0
+
+    _KERNEL_CACHE[key] = kernel
+    return kernel
+
+# ---------------------------------------------------------------------------
+# Jitted flat-array point kernels: the same per-point logic as the classes
+# above, rewritten over NumPy stat vectors and int64 counters so Numba can
+# compile the whole loop.
+# ---------------------------------------------------------------------------
+def stats_array(stats):
+    """
+    Flatten a stats dict into the fixed _STAT_KEYS column order. float32
+    is plenty for percent-scale stats and halves the kernels' memory
+    traffic while doubling SIMD lanes in the vectorized math.
+    """
+    return np.array([stats.get(k, 50.0 if k == 'return_RiPW' else 0.0)
+                     for k in _STAT_KEYS], dtype=np.float32)
+
+@njit(cache=True)
+def simulate_point_fast(server_stats, receiver_stats, elo_f, server_counts, receiver_counts):
+    """
+    Simulate one point on flat arrays. Returns 1 if the server wins it,
+    else 0. Mirrors ServeSimulator/RallySimulator/PointSimulator exactly,
+    including the 0.9-1.1 ace variance draws.
+    """
+    # --- First serve ---
+    if np.random.random() * 100 < server_stats[FIRST_SERVE_IN]:
+        variance = 0.9 + 0.2 * np.random.random()
+        effective_ace = (server_stats[ACE_1ST] * elo_f
+                         - 0.5 * receiver_stats[ACE_AGAINST]) * variance
+        if effective_ace < 0.5:
+            effective_ace = 0.5
+        if np.random.random() * 100 < effective_ace:
+            server_counts[ACES] += 1
+            server_counts[PTS_SERVE] += 1
+            return 1
+        if np.random.random() * 100 < server_stats[SNV_FREQ] * elo_f:
+            if np.random.random() * 100 < server_stats[SNV_WIN] * elo_f:
+                server_counts[SNV_W] += 1
+                server_counts[PTS_SERVE] += 1
+                return 1
+            server_counts[SNV_L] += 1
+            return 0
+    else:
+        # --- Second serve ---
+        if np.random.random() * 100 < server_stats[DOUBLE_FAULT]:
+            server_counts[DFS] += 1
+            return 0
+        variance = 0.9 + 0.2 * np.random.random()
+        effective_ace = (server_stats[ACE_2ND] * elo_f
+                         - 0.5 * receiver_stats[ACE_AGAINST]) * variance
+        if effective_ace < 0.5:
+            effective_ace = 0.5
+        if np.random.random() * 100 < effective_ace:
+            server_counts[ACES] += 1
+            server_counts[PTS_SERVE] += 1
+            return 1
+
+    # --- Rally ---
+    r = np.random.random()
+    if r < 0.30:
+        base_rally_win = server_stats[RALLY_1_3]
+    elif r < 0.70:
+        base_rally_win = server_stats[RALLY_4_6]
+    elif r < 0.90:
+        base_rally_win = server_stats[RALLY_7_9]
+    else:
+        base_rally_win = server_stats[RALLY_10PLUS]
+    receiver_defense = 100 - receiver_stats[RETURN_RIPW]
+    effective_rally_win = ((base_rally_win + receiver_defense) / 2) * elo_f / 100.0
+    if np.random.random() < effective_rally_win:
+        server_counts[RALLY_W_SRV] += 1
+        return 1
+    receiver_counts[RALLY_W_RCV] += 1
+    return 0
+
+@njit(cache=True, parallel=True)
+def run_match(stats_a, stats_b, elo_a, elo_b, n_points):
+    """
+    Simulate n_points with alternating serve (player A serves the even
+    points) across prange blocks. Each block accumulates into its own
+    counter rows so the parallel loop has no shared writes; the rows are
+    reduced at the end. Returns (points_won_a, counts_a, counts_b).
+    """
+    elo_ab = 1.0 + ELO_K * (elo_a - elo_b)
+    elo_ba = 1.0 + ELO_K * (elo_b - elo_a)
+    n_blocks = 16
+    block = (n_points + n_blocks - 1) // n_blocks
+    counts_a = np.zeros((n_blocks, N_COUNTS), dtype=np.int32)
+    counts_b = np.zeros((n_blocks, N_COUNTS), dtype=np.int32)
+    won_a = np.zeros(n_blocks, dtype=np.int64)
+    for b in prange(n_blocks):
+        start = b * block
+        end = min(n_points, start + block)
+        for i in range(start, end):
+            if i % 2 == 0:
+                won_a[b] += simulate_point_fast(
+                    stats_a, stats_b, elo_ab, counts_a[b], counts_b[b])
+            else:
+                won_a[b] += 1 - simulate_point_fast(
+                    stats_b, stats_a, elo_ba, counts_b[b], counts_a[b])
+    return won_a.sum(), counts_a.sum(axis=0), counts_b.sum(axis=0)
+
+# ---------------------------------------------------------------------------
+# simulate_batch: Vectorized simulation of n serves by one server.
+# ---------------------------------------------------------------------------
+def simulate_batch(server: TennisPlayer, receiver: TennisPlayer, n, rng):
+    """
+    Simulate n serves by `server` as bulk NumPy ops: the serve-outcome
+    tree collapses into a precomputed cumulative categorical resolved by
+    one searchsorted per batch, rally points resolve the same way, and no
+    Python-level per-point loop runs at all. Tallies accumulate into the
+    players' point_stats; returns the number of points the server won.
+    """
+    s = server.stats
+    elo_factor = 1.0 + ELO_K * (server.elo - receiver.elo)
+    opp_ace = receiver.stats.get('ace_rate_against', 0)
+
+    # With the matchup fixed, the serve outcome is a 7-way categorical:
+    # [ace on 1st, S&V win, S&V loss, in play after 1st,
+    #  double fault, ace on 2nd, in play after 2nd].
+    # One multiplicative perturbation draw per batch stands in for the
+    # per-point 0.9-1.1 ace variance (same mean; the residual variance
+    # rides on a single batch-level draw), one searchsorted against the
+    # cumulative table replaces the whole nested mask cascade, and
+    # bincount routes the tallies.
+    p_in = s['first_serve_in_pct'] / 100.0
+    df_p = s['double_fault_pct'] / 100.0
+    snv_freq_p = s['serve_and_volley_freq'] * elo_factor / 100.0
+    snv_win_p = s['serve_and_volley_win_pct'] * elo_factor / 100.0
+    variance = 0.9 + 0.2 * rng.random()
+    eff_ace1 = max(0.5, (s['ace_rate_1st'] * elo_factor - 0.5 * opp_ace) * variance) / 100.0
+    eff_ace2 = max(0.5, (s['ace_rate_2nd'] * elo_factor - 0.5 * opp_ace) * variance) / 100.0
+
+    p_table = np.array([
+        p_in * eff_ace1,
+        p_in * (1 - eff_ace1) * snv_freq_p * snv_win_p,
+        p_in * (1 - eff_ace1) * snv_freq_p * (1 - snv_win_p),
+        p_in * (1 - eff_ace1) * (1 - snv_freq_p),
+        (1 - p_in) * df_p,
+        (1 - p_in) * (1 - df_p) * eff_ace2,
+        (1 - p_in) * (1 - df_p) * (1 - eff_ace2),
+    ])
+    outcome = np.searchsorted(np.cumsum(p_table), rng.random(n, dtype=np.float32))
+    outcome_counts = np.bincount(outcome, minlength=7)
+
+    n_aces = int(outcome_counts[0] + outcome_counts[5])
+    n_snv_wins = int(outcome_counts[1])
+    n_snv_losses = int(outcome_counts[2])
+    n_dfs = int(outcome_counts[4])
+    n_rally = int(outcome_counts[3] + outcome_counts[6])
+
+    # Rally resolution for the in-play points only: searchsorted on the
+    # cumulative bracket probabilities yields each bracket index, and
+    # per-bracket values are gathered by that index.
+    bracket = np.searchsorted(RALLY_BRACKET_CUM, rng.random(n_rally, dtype=np.float32))
+    base_rally_win = np.array([
+        s['rally_1_3_win'], s['rally_4_6_win'],
+        s['rally_7_9_win'], s['rally_10plus_win'],
+    ], dtype=np.float32)[bracket]
+    receiver_defense = 100 - receiver.stats.get('return_RiPW', 50)
+    effective_rally_win = ((base_rally_win + receiver_defense) / 2) * elo_factor / 100.0
+    n_rally_wins = int(np.count_nonzero(
+        rng.random(n_rally, dtype=np.float32) < effective_rally_win))
+
+    server.point_stats[ACES] += n_aces
+    server.point_stats[DFS] += n_dfs
+    server.point_stats[SNV_W] += n_snv_wins
+    server.point_stats[SNV_L] += n_snv_losses
+    server.point_stats[PTS_SERVE] += n_aces + n_snv_wins
+    server.point_stats[RALLY_W_SRV] += n_rally_wins
+    receiver.point_stats[RALLY_W_RCV] += n_rally - n_rally_wins
+    return n_aces + n_snv_wins + n_rally_wins
+
 # ---------------------------------------------------------------------------
 # compute_expected_outcomes: Computes expected (base) outcome rates for a serving player,
 # using a weighted rally-length distribution.
 # ---------------------------------------------------------------------------
-def compute_expected_outcomes(server: TennisPlayer, receiver: TennisPlayer):
-    stats = server.stats
-    elo_factor = 1 + ELO_ADJUSTMENT_FACTOR * ((server.elo - receiver.elo) / LEAGUE_AVG_ELO)
-    p_in = stats['first_serve_in_pct'] / 100.0
+def expected_outcomes_vec(stats_arr, elo_factor):
+    """
+    Dict-free expected rates over a flat _STAT_KEYS stat vector. Returns
+    the six tracked per-serve rates (%) as an array in
+    POINT_STAT_LABELS[:6] order, so it can be reused against the batch
+    kernels' outputs without any dict round-trips.
+    """
+    p_in = stats_arr[FIRST_SERVE_IN] / 100.0
 
     # Effective ace chance on first serve:
-    ace_first = max(0, stats['ace_rate_1st'] * elo_factor - stats.get('ace_rate_against', 0)) / 100.0
+    ace_first = max(0.0, stats_arr[ACE_1ST] * elo_factor - stats_arr[ACE_AGAINST]) / 100.0
     expected_aces_first = p_in * ace_first
 
     # Effective ace chance on second serve:
-    ace_second = max(0, stats['ace_rate_2nd'] * elo_factor - stats.get('ace_rate_against', 0)) / 100.0
-    expected_aces_second = (1 - p_in) * (1 - stats['double_fault_pct'] / 100.0) * ace_second
+    ace_second = max(0.0, stats_arr[ACE_2ND] * elo_factor - stats_arr[ACE_AGAINST]) / 100.0
+    df_p = stats_arr[DOUBLE_FAULT] / 100.0
+    expected_aces_second = (1 - p_in) * (1 - df_p) * ace_second
 
     expected_aces = expected_aces_first + expected_aces_second
 
-    expected_double_faults = (1 - p_in) * (stats['double_fault_pct'] / 100.0)
+    expected_double_faults = (1 - p_in) * df_p
 
-    effective_snv_freq = stats['serve_and_volley_freq'] * elo_factor / 100.0
-    effective_snv_win = stats['serve_and_volley_win_pct'] * elo_factor / 100.0
+    effective_snv_freq = stats_arr[SNV_FREQ] * elo_factor / 100.0
+    effective_snv_win = stats_arr[SNV_WIN] * elo_factor / 100.0
     expected_snv_wins = p_in * effective_snv_freq * effective_snv_win
     expected_snv_losses = p_in * effective_snv_freq * (1 - effective_snv_win)
 
     expected_points_on_serve = (expected_aces + expected_snv_wins) * 100  # as percentage
 
-    # For rally, using weighted probabilities for each bracket:
-    p_brackets = {'1-3': 0.30, '4-6': 0.40, '7-9': 0.20, '10+': 0.10}
+    # For rally, using the bracket probabilities as weights:
     weighted_rally = (
-        p_brackets['1-3'] * stats['rally_1_3_win'] +
-        p_brackets['4-6'] * stats['rally_4_6_win'] +
-        p_brackets['7-9'] * stats['rally_7_9_win'] +
-        p_brackets['10+'] * stats['rally_10plus_win']
+        0.30 * stats_arr[RALLY_1_3] +
+        0.40 * stats_arr[RALLY_4_6] +
+        0.20 * stats_arr[RALLY_7_9] +
+        0.10 * stats_arr[RALLY_10PLUS]
     )
-    effective_rally_win = ((weighted_rally + (100 - stats['return_RiPW'])) / 2.0) * elo_factor / 100.0
+    effective_rally_win = ((weighted_rally + (100 - stats_arr[RETURN_RIPW])) / 2.0) * elo_factor / 100.0
     prob_rally = 1 - (expected_aces + expected_snv_wins + expected_double_faults + expected_snv_losses)
     expected_rally_win = prob_rally * effective_rally_win * 100  # as percentage
 
-    return {
-        'Aces': expected_aces * 100,
-        'Double Faults': expected_double_faults * 100,
-        'Serve & Volley Wins': expected_snv_wins * 100,
-        'Serve & Volley Losses': expected_snv_losses * 100,
-        'Points Won on Serve': expected_points_on_serve,
-        'Rally Wins as Server': expected_rally_win,
-    }
+    return np.array([
+        expected_aces * 100,
+        expected_double_faults * 100,
+        expected_snv_wins * 100,
+        expected_snv_losses * 100,
+        expected_points_on_serve,
+        expected_rally_win,
+    ])
+
+def compute_expected_outcomes(server: TennisPlayer, receiver: TennisPlayer):
+    """Labeled wrapper over expected_outcomes_vec for a player pair."""
+    elo_factor = 1.0 + ELO_K * (server.elo - receiver.elo)
+    values = expected_outcomes_vec(stats_array(server.stats), elo_factor)
+    return dict(zip(POINT_STAT_LABELS[:6], values.tolist()))
+
+# ---------------------------------------------------------------------------
+# simulate_match / run_replicates: One full simulation as a seedable pure
+# function, plus a process-pool runner for independent replicates.
+# ---------------------------------------------------------------------------
+def simulate_match(stats_a, elo_a, stats_b, elo_b, n_points, seed=None):
+    """
+    Run one n_points alternating-serve simulation (half the serves each
+    way) from its own seeded generator and return
+    (won_serving_a, won_serving_b, counts_a, counts_b). Because each call
+    owns its RNG and players, calls are fully independent — the unit of
+    work for parallel replication.
+    """
+    rng = np.random.default_rng(seed)
+    a = TennisPlayer("A", elo=elo_a, stats=stats_a)
+    b = TennisPlayer("B", elo=elo_b, stats=stats_b)
+    serves = n_points // 2
+    won_a = simulate_batch(a, b, serves, rng)
+    won_b = simulate_batch(b, a, serves, rng)
+    return won_a, won_b, a.point_stats, b.point_stats
+
+def _replicate(args):
+    """Pool worker: one seeded simulate_match call."""
+    return simulate_match(*args)
+
+def run_replicates(stats_a, elo_a, stats_b, elo_b, n_points, n_replicates,
+                   max_workers=None, seed=None):
+    """
+    Launch n_replicates independent simulate_match runs across a process
+    pool and reduce them by summing points won and the event-count
+    arrays elementwise. Replicates share nothing, so scaling is linear up
+    to core count; per-replicate seeds come from SeedSequence.spawn so
+    worker streams never overlap and a fixed root seed reproduces the
+    whole batch. Returns (won_a, won_b, counts_a, counts_b) totals.
+    """
+    children = np.random.SeedSequence(seed).spawn(n_replicates)
+    jobs = [(stats_a, elo_a, stats_b, elo_b, n_points, child.generate_state(1)[0])
+            for child in children]
+    won_a = 0
+    won_b = 0
+    counts_a = np.zeros(N_COUNTS, dtype=np.int64)
+    counts_b = np.zeros(N_COUNTS, dtype=np.int64)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for rep_won_a, rep_won_b, rep_counts_a, rep_counts_b in pool.map(_replicate, jobs):
+            won_a += rep_won_a
+            won_b += rep_won_b
+            counts_a += rep_counts_a
+            counts_b += rep_counts_b
+    return won_a, won_b, counts_a, counts_b
 
 # ---------------------------------------------------------------------------
 # Main Execution: Simulate 5,000 points with alternating serve and display detailed summary.
@@ -269,37 +704,28 @@ if __name__ == "__main__":
     aryna = TennisPlayer("Aryna Sabalenka", elo=2000, stats=sabalenka_stats)
     
     total_points = 5000
-    serves_per_player = total_points / 2  # 2,500 serves per player
-
-    # Counters for total points won (regardless of serving)
-    total_points_iga = 0
-    total_points_aryna = 0
-
-    # Alternate serve: even-indexed points => Iga serves; odd-indexed => Aryna serves.
-    for i in range(total_points):
-        if i % 2 == 0:
-            winner = PointSimulator.simulate_point(iga, aryna)
-            if winner == iga.name:
-                total_points_iga += 1
-            else:
-                total_points_aryna += 1
-        else:
-            winner = PointSimulator.simulate_point(aryna, iga)
-            if winner == aryna.name:
-                total_points_aryna += 1
-            else:
-                total_points_iga += 1
-    
+    serves_per_player = total_points // 2  # 2,500 serves per player
+
+    # One simulate_match call covers both serving sides as vectorized
+    # batches; the same function is what run_replicates fans out across a
+    # process pool when many independent replicates are wanted.
+    (iga_won_serving, aryna_won_serving,
+     iga_counts, aryna_counts) = simulate_match(
+        iga.stats, iga.elo, aryna.stats, aryna.elo, total_points)
+    iga.point_stats += iga_counts
+    aryna.point_stats += aryna_counts
+
+    # Totals across both roles: points won serving plus the opponent's
+    # service points she lost.
+    total_points_iga = iga_won_serving + (serves_per_player - aryna_won_serving)
+    total_points_aryna = aryna_won_serving + (serves_per_player - iga_won_serving)
+
     # Function to calculate simulated per-serve percentages for a serving player.
+    # Columns 0-5 of the count array are the tracked per-serve events, so
+    # one broadcast division covers all six.
     def simulated_rate(player):
-        return {
-            'Aces': (player.point_stats['Aces'] / serves_per_player) * 100,
-            'Double Faults': (player.point_stats['Double Faults'] / serves_per_player) * 100,
-            'Serve & Volley Wins': (player.point_stats['Serve & Volley Wins'] / serves_per_player) * 100,
-            'Serve & Volley Losses': (player.point_stats['Serve & Volley Losses'] / serves_per_player) * 100,
-            'Points Won on Serve': (player.point_stats['Points Won on Serve'] / serves_per_player) * 100,
-            'Rally Wins as Server': (player.point_stats['Rally Wins as Server'] / serves_per_player) * 100,
-        }
+        rates = player.point_stats[:6] * (100.0 / serves_per_player)
+        return dict(zip(POINT_STAT_LABELS[:6], rates.tolist()))
     
     sim_rates_iga = simulated_rate(iga)
     sim_rates_aryna = simulated_rate(aryna)
@@ -328,8 +754,8 @@ if __name__ == "__main__":
     print(f"  Aryna Sabalenka: {total_points_aryna} points\n")
     
     print("Detailed Point Stats (Absolute counts):")
-    print(f"Iga Swiatek: {iga.point_stats}")
-    print(f"Aryna Sabalenka: {aryna.point_stats}")
+    print(f"Iga Swiatek: {iga.point_stats_dict()}")
+    print(f"Aryna Sabalenka: {aryna.point_stats_dict()}")
     
     print("\nNote: Base rates are computed from the input stats (adjusted by Elo and opposing stats),")
     print("and the rally calculations now use a weighted distribution of rally lengths.")